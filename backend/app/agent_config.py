@@ -0,0 +1,110 @@
+import threading
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.db import AgentRecord
+
+
+class AgentConfig:
+    """The agent fields the voice path reads, detached from the ORM session."""
+
+    __slots__ = (
+        "id",
+        "agent_id",
+        "organization_id",
+        "name",
+        "model",
+        "voice_id",
+        "prompt",
+        "prompt_version",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        agent_id: str,
+        organization_id: Optional[int],
+        name: str,
+        model: str,
+        voice_id: str,
+        prompt: str,
+        prompt_version: str,
+        updated_at: datetime,
+    ) -> None:
+        self.id = id
+        self.agent_id = agent_id
+        self.organization_id = organization_id
+        self.name = name
+        self.model = model
+        self.voice_id = voice_id
+        self.prompt = prompt
+        self.prompt_version = prompt_version
+        self.updated_at = updated_at
+
+
+class AgentConfigCache:
+    """Read-through cache of agent configs keyed by ``(agent_id, prompt_version)``."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], AgentConfig] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, agent_pk: int) -> Optional[AgentConfig]:
+        version_row = db.execute(
+            select(AgentRecord.agent_id, AgentRecord.prompt_version, AgentRecord.updated_at).where(
+                AgentRecord.id == agent_pk
+            )
+        ).first()
+
+        if version_row is None:
+            return None
+
+        agent_id, prompt_version, updated_at = version_row
+        config = self._entries.get((agent_id, prompt_version))
+
+        if config is not None and config.updated_at == updated_at:
+            return config
+
+        row = db.execute(
+            select(
+                AgentRecord.id,
+                AgentRecord.agent_id,
+                AgentRecord.organization_id,
+                AgentRecord.name,
+                AgentRecord.model,
+                AgentRecord.voice_id,
+                AgentRecord.prompt,
+                AgentRecord.prompt_version,
+                AgentRecord.updated_at,
+            ).where(AgentRecord.id == agent_pk)
+        ).first()
+
+        if row is None:
+            return None
+
+        config = AgentConfig(*row)
+
+        with self._lock:
+            self._drop(config.agent_id)
+            self._entries[(config.agent_id, config.prompt_version)] = config
+
+        return config
+
+    def invalidate(self, agent_id: str) -> None:
+        with self._lock:
+            self._drop(agent_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _drop(self, agent_id: str) -> None:
+        for key in [key for key in self._entries if key[0] == agent_id]:
+            del self._entries[key]
+
+
+agent_configs = AgentConfigCache()
@@ -0,0 +1,76 @@
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from backend.app.core.settings import get_settings
+from backend.app.db import AgentRecord, normalize_e164
+
+settings = get_settings()
+
+
+class AgentRoutingTable:
+    """In-process map from normalized Twilio number to agent primary key."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._routes: dict[str, int] = {}
+        self._fallback_id: Optional[int] = None
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def resolve(self, db: Session, to_number: str) -> Optional[int]:
+        self._ensure_loaded(db)
+        normalized_to = normalize_e164(to_number)
+        agent_pk = self._routes.get(normalized_to)
+
+        if agent_pk is not None:
+            return agent_pk
+
+        if normalized_to:
+            row = (
+                db.query(AgentRecord.id)
+                .filter(AgentRecord.twilio_number_e164 == normalized_to)
+                .order_by(AgentRecord.id.asc())
+                .first()
+            )
+
+            if row is not None:
+                self._routes[normalized_to] = row[0]
+                return row[0]
+
+        return self._fallback_id
+
+    def _ensure_loaded(self, db: Session) -> None:
+        loaded_at = self._loaded_at
+
+        if loaded_at is not None and time.monotonic() - loaded_at < self.ttl_seconds:
+            return
+
+        with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_seconds:
+                return
+
+            rows = (
+                db.query(AgentRecord.id, AgentRecord.twilio_number_e164, AgentRecord.status)
+                .order_by(AgentRecord.id.asc())
+                .all()
+            )
+            routes: dict[str, int] = {}
+
+            for agent_pk, number, _ in rows:
+                if number:
+                    routes.setdefault(number, agent_pk)
+
+            first_active = next((agent_pk for agent_pk, _, agent_status in rows if agent_status == "active"), None)
+            self._routes = routes
+            self._fallback_id = first_active if first_active is not None else (rows[0][0] if rows else None)
+            self._loaded_at = time.monotonic()
+
+
+agent_routes = AgentRoutingTable(ttl_seconds=settings.agent_routing_ttl_seconds)
@@ -2,6 +2,7 @@ from backend.app.api.routes.agents import router as agents_router
 from backend.app.api.routes.auth import router as auth_router
 from backend.app.api.routes.calls import router as calls_router
 from backend.app.api.routes.dashboard import router as dashboard_router
+from backend.app.api.routes.events import router as events_router
 from backend.app.api.routes.health import router as health_router
 from backend.app.api.routes.organizations import router as organizations_router
 from backend.app.api.routes.settings import router as settings_router
@@ -12,6 +13,7 @@ __all__ = [
     "auth_router",
     "calls_router",
     "dashboard_router",
+    "events_router",
     "health_router",
     "organizations_router",
     "settings_router",
@@ -2,9 +2,23 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from backend.app.db import AgentRecord, get_db
+from backend.app.agent_config import agent_configs
+from backend.app.agent_routing import agent_routes
+from backend.app.db import (
+    AgentRecord,
+    OrganizationRecord,
+    get_db,
+    get_read_db,
+    normalize_e164,
+    normalize_organization_name,
+)
+from backend.app.events import AGENT_CHANGED_EVENT, event_bus
+from backend.app.ids import allocate_external_id
+from backend.app.organizations import ensure_organization
+from backend.app.response_cache import DASHBOARD_CACHE_TAG, ORGANIZATIONS_CACHE_TAG, response_cache
 from backend.app.schemas import Agent, AgentCreate, AgentStatus, AgentUpdate
 
 router = APIRouter(prefix="/agents", tags=["agents"])
@@ -25,24 +39,17 @@ def _to_schema(record: AgentRecord) -> Agent:
     )
 
 
-def _next_agent_id(db: Session) -> str:
-    numeric_ids = []
-
-    for record in db.query(AgentRecord).all():
-        try:
-            numeric_ids.append(int(record.agent_id.split("-")[-1]))
-        except ValueError:
-            continue
-
-    next_id = (max(numeric_ids) if numeric_ids else 0) + 1
-    return f"agent-{next_id}"
+def _publish_agent_change(action: str, agent: Agent) -> Agent:
+    event_bus.publish(AGENT_CHANGED_EVENT, {"action": action, "agent": agent.model_dump(by_alias=True, mode="json")})
+    return agent
 
 
 @router.get("", response_model=list[Agent])
 def list_agents(
     status: Optional[AgentStatus] = Query(default=None),
     organization_name: Optional[str] = Query(default=None, alias="organizationName"),
-    db: Session = Depends(get_db),
+    organization_id: Optional[str] = Query(default=None, alias="organizationId"),
+    db: Session = Depends(get_read_db),
 ) -> list[Agent]:
     query = db.query(AgentRecord)
 
@@ -50,8 +57,20 @@ def list_agents(
         query = query.filter(AgentRecord.status == status.value)
 
     if organization_name is not None:
-        normalized_org = organization_name.strip().lower()
-        query = query.filter(AgentRecord.organization_name.ilike(normalized_org))
+        query = query.filter(
+            AgentRecord.organization_id
+            == select(OrganizationRecord.id)
+            .where(OrganizationRecord.name_normalized == normalize_organization_name(organization_name))
+            .scalar_subquery()
+        )
+
+    if organization_id is not None:
+        query = query.filter(
+            AgentRecord.organization_id
+            == select(OrganizationRecord.id)
+            .where(OrganizationRecord.organization_id == organization_id)
+            .scalar_subquery()
+        )
 
     return [_to_schema(record) for record in query.order_by(AgentRecord.id.asc()).all()]
 
@@ -59,23 +78,28 @@ def list_agents(
 @router.post("", response_model=Agent, status_code=status.HTTP_201_CREATED)
 def create_agent(payload: AgentCreate, db: Session = Depends(get_db)) -> Agent:
     record = AgentRecord(
-        agent_id=_next_agent_id(db),
+        agent_id=allocate_external_id(db, "agent"),
         name=payload.name,
+        organization_id=ensure_organization(db, payload.organization_name).id,
         organization_name=payload.organization_name,
         model=payload.model,
         voice_id=payload.voice_id,
         twilio_number=payload.twilio_number,
+        twilio_number_e164=normalize_e164(payload.twilio_number),
         status=payload.status,
         prompt=payload.prompt,
         prompt_version=payload.prompt_version,
         average_latency_ms=payload.average_latency_ms,
+        created_at=datetime.now(timezone.utc),
         updated_at=datetime.now(timezone.utc),
     )
 
     db.add(record)
     db.commit()
     db.refresh(record)
-    return _to_schema(record)
+    agent_routes.invalidate()
+    response_cache.invalidate(DASHBOARD_CACHE_TAG, ORGANIZATIONS_CACHE_TAG)
+    return _publish_agent_change("created", _to_schema(record))
 
 
 @router.patch("/{agent_id}", response_model=Agent)
@@ -91,12 +115,19 @@ def update_agent(agent_id: str, payload: AgentUpdate, db: Session = Depends(get_
         if hasattr(record, field):
             setattr(record, field, value)
 
+    if "organization_name" in updates:
+        record.organization_id = ensure_organization(db, record.organization_name).id
+
+    record.twilio_number_e164 = normalize_e164(record.twilio_number)
     record.updated_at = datetime.now(timezone.utc)
 
     db.add(record)
     db.commit()
     db.refresh(record)
-    return _to_schema(record)
+    agent_routes.invalidate()
+    agent_configs.invalidate(record.agent_id)
+    response_cache.invalidate(DASHBOARD_CACHE_TAG, ORGANIZATIONS_CACHE_TAG)
+    return _publish_agent_change("updated", _to_schema(record))
 
 
 @router.delete("/{agent_id}", response_model=Agent)
@@ -109,4 +140,7 @@ def delete_agent(agent_id: str, db: Session = Depends(get_db)) -> Agent:
     deleted = _to_schema(record)
     db.delete(record)
     db.commit()
-    return deleted
+    agent_routes.invalidate()
+    agent_configs.invalidate(deleted.id)
+    response_cache.invalidate(DASHBOARD_CACHE_TAG, ORGANIZATIONS_CACHE_TAG)
+    return _publish_agent_change("deleted", deleted)
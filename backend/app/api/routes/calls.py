@@ -1,48 +1,339 @@
-from datetime import timezone
-from typing import Optional
+import csv
+import io
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime, timezone
+from importlib.util import find_spec
+from typing import Iterator, Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import desc
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import desc, select, tuple_
 from sqlalchemy.orm import Session
 
-from backend.app.db import CallSessionRecord, get_db
-from backend.app.schemas import CallSession, CallStatus
+from backend.app.call_archive import call_archive
+from backend.app.db import (
+    CallSessionRecord,
+    OrganizationRecord,
+    ReadSessionLocal,
+    get_read_db,
+    normalize_agent_name,
+)
+from backend.app.schemas import CallExportFormat, CallSession, CallStatus
+from backend.app.security import require_roles
 
 router = APIRouter(prefix="/calls", tags=["calls"])
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = (
+    ("id", CallSessionRecord.call_id),
+    ("agentName", CallSessionRecord.agent_name),
+    ("callerNumber", CallSessionRecord.caller_number),
+    ("startedAt", CallSessionRecord.started_at),
+    ("durationSeconds", CallSessionRecord.duration_seconds),
+    ("status", CallSessionRecord.status),
+    ("sentiment", CallSessionRecord.sentiment),
+    ("recordingUrl", CallSessionRecord.recording_url),
+)
+EXPORT_MEDIA_TYPES = {
+    CallExportFormat.ndjson: "application/x-ndjson",
+    CallExportFormat.csv: "text/csv",
+    CallExportFormat.parquet: "application/vnd.apache.parquet",
+}
+
+
+def _encode_cursor(row: CallSessionRecord) -> str:
+    payload = json.dumps({"startedAt": row.started_at.isoformat(), "id": row.id}, separators=(",", ":"))
+    return urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["startedAt"]), int(payload["id"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Invalid cursor",
+        ) from exc
+
+
+def _to_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+
+    return value.astimezone(timezone.utc)
+
+
+def _parse_export_timestamp(value: str) -> datetime:
+    try:
+        return _to_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Invalid ISO datetime: {value}",
+        ) from exc
+
+
+def _apply_call_filters(
+    statement,
+    call_status: Optional[CallStatus],
+    agent_name: Optional[str],
+    organization_id: Optional[str] = None,
+):
+    if organization_id is not None:
+        statement = statement.filter(
+            CallSessionRecord.organization_id
+            == select(OrganizationRecord.id)
+            .where(OrganizationRecord.organization_id == organization_id)
+            .scalar_subquery()
+        )
+
+    if call_status is not None:
+        statement = statement.filter(CallSessionRecord.status == call_status.value)
+
+    if agent_name is not None:
+        statement = statement.filter(CallSessionRecord.agent_name_normalized == normalize_agent_name(agent_name))
+
+    return statement
+
+
+def _archived_call_batches(
+    db: Session,
+    call_status: Optional[CallStatus],
+    agent_name: Optional[str],
+    organization_id: Optional[str],
+    **bounds,
+) -> Iterator[list[CallSessionRecord]]:
+    organization_pk = None
+
+    if organization_id is not None:
+        organization_pk = db.scalar(
+            select(OrganizationRecord.id).where(OrganizationRecord.organization_id == organization_id)
+        )
+
+        if organization_pk is None:
+            return
+
+    yield from call_archive.read(
+        call_status=call_status.value if call_status is not None else None,
+        agent_name_normalized=normalize_agent_name(agent_name) if agent_name is not None else None,
+        organization_id=organization_pk,
+        **bounds,
+    )
+
+
+def call_session_to_schema(row: CallSessionRecord) -> CallSession:
+    return CallSession(
+        id=row.call_id,
+        agent_name=row.agent_name,
+        caller_number=row.caller_number,
+        started_at=_to_utc(row.started_at).strftime("%Y-%m-%d %H:%M"),
+        duration_seconds=row.duration_seconds,
+        status=row.status,
+        sentiment=row.sentiment,
+        recording_url=row.recording_url,
+    )
+
+
+def _export_record(values) -> dict[str, object]:
+    record = dict(zip((name for name, _ in EXPORT_COLUMNS), values))
+    record["startedAt"] = _to_utc(record["startedAt"]).isoformat().replace("+00:00", "Z")
+    return record
+
+
+def _iter_export_batches(
+    call_status: Optional[CallStatus],
+    agent_name: Optional[str],
+    organization_id: Optional[str],
+    from_ts: Optional[datetime],
+    to_ts: Optional[datetime],
+) -> Iterator[list[dict[str, object]]]:
+    statement = select(*(column for _, column in EXPORT_COLUMNS))
+    statement = _apply_call_filters(statement, call_status, agent_name, organization_id)
+
+    if from_ts is not None:
+        statement = statement.filter(CallSessionRecord.started_at >= from_ts)
+
+    if to_ts is not None:
+        statement = statement.filter(CallSessionRecord.started_at <= to_ts)
+
+    statement = statement.order_by(CallSessionRecord.started_at.asc(), CallSessionRecord.id.asc())
+
+    with ReadSessionLocal() as db:
+        # Archived months are older than anything left in call_sessions, so they stream first.
+        for archived in _archived_call_batches(
+            db,
+            call_status,
+            agent_name,
+            organization_id,
+            from_ts=from_ts,
+            to_ts=to_ts,
+        ):
+            yield [_export_record([getattr(row, column.key) for _, column in EXPORT_COLUMNS]) for row in archived]
+
+        result = db.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+        for partition in result.partitions():
+            yield [_export_record(row) for row in partition]
+
+
+def _stream_ndjson(batches: Iterator[list[dict[str, object]]]) -> Iterator[bytes]:
+    for batch in batches:
+        yield "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in batch).encode("utf-8")
+
+
+def _stream_csv(batches: Iterator[list[dict[str, object]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=[name for name, _ in EXPORT_COLUMNS])
+    writer.writeheader()
+
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose contents are drained after every Parquet row group."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        drained = b"".join(self.chunks)
+        self.chunks.clear()
+        return drained
+
+
+def _stream_parquet(batches: Iterator[list[dict[str, object]]]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [
+            ("id", pa.string()),
+            ("agentName", pa.string()),
+            ("callerNumber", pa.string()),
+            ("startedAt", pa.string()),
+            ("durationSeconds", pa.int64()),
+            ("status", pa.string()),
+            ("sentiment", pa.string()),
+            ("recordingUrl", pa.string()),
+        ]
+    )
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+
+    try:
+        for batch in batches:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
 
 
 @router.get("", response_model=list[CallSession])
 def list_calls(
+    response: Response,
     status: Optional[CallStatus] = Query(default=None),
     agent_name: Optional[str] = Query(default=None, alias="agentName"),
+    organization_id: Optional[str] = Query(default=None, alias="organizationId"),
     limit: int = Query(default=50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(default=None),
+    db: Session = Depends(get_read_db),
 ) -> list[CallSession]:
-    query = db.query(CallSessionRecord)
+    query = _apply_call_filters(db.query(CallSessionRecord), status, agent_name, organization_id)
+    bound = _decode_cursor(cursor) if cursor else None
 
-    if status is not None:
-        query = query.filter(CallSessionRecord.status == status.value)
+    if bound is not None:
+        query = query.filter(tuple_(CallSessionRecord.started_at, CallSessionRecord.id) < tuple_(*bound))
 
-    if agent_name is not None:
-        normalized_agent = agent_name.strip().lower()
-        query = query.filter(CallSessionRecord.agent_name.ilike(normalized_agent))
-
-    rows = query.order_by(desc(CallSessionRecord.started_at)).limit(limit).all()
-
-    return [
-        CallSession(
-            id=row.call_id,
-            agent_name=row.agent_name,
-            caller_number=row.caller_number,
-            started_at=(
-                row.started_at.replace(tzinfo=timezone.utc)
-                if row.started_at.tzinfo is None
-                else row.started_at.astimezone(timezone.utc)
-            ).strftime("%Y-%m-%d %H:%M"),
-            duration_seconds=row.duration_seconds,
-            status=row.status,
-            sentiment=row.sentiment,
-            recording_url=row.recording_url,
+    rows = (
+        query.order_by(desc(CallSessionRecord.started_at), desc(CallSessionRecord.id))
+        .limit(limit + 1)
+        .all()
+    )
+
+    if len(rows) <= limit:
+        # The hot table ran out for this page; continue into archived months.
+        for archived in _archived_call_batches(
+            db,
+            status,
+            agent_name,
+            organization_id,
+            before=bound,
+            newest_first=True,
+            limit=limit + 1,
+        ):
+            rows.extend(archived)
+
+        rows.sort(key=lambda row: (_to_utc(row.started_at), row.id), reverse=True)
+        rows = rows[: limit + 1]
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(rows[-1])
+
+    return [call_session_to_schema(row) for row in rows]
+
+
+@router.get("/export")
+def export_calls(
+    export_format: CallExportFormat = Query(default=CallExportFormat.ndjson, alias="format"),
+    call_status: Optional[CallStatus] = Query(default=None, alias="status"),
+    agent_name: Optional[str] = Query(default=None, alias="agentName"),
+    organization_id: Optional[str] = Query(default=None, alias="organizationId"),
+    from_date: Optional[str] = Query(default=None, alias="fromDate"),
+    to_date: Optional[str] = Query(default=None, alias="toDate"),
+    _: str = Depends(require_roles(["admin", "editor", "viewer"])),
+) -> StreamingResponse:
+    from_ts = _parse_export_timestamp(from_date) if from_date else None
+    to_ts = _parse_export_timestamp(to_date) if to_date else None
+
+    if from_ts and to_ts and from_ts > to_ts:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="fromDate must be less than or equal to toDate",
         )
-        for row in rows
-    ]
+
+    batches = _iter_export_batches(call_status, agent_name, organization_id, from_ts, to_ts)
+
+    if export_format == CallExportFormat.parquet:
+        if find_spec("pyarrow") is None:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Parquet export requires the pyarrow package",
+            )
+
+        body = _stream_parquet(batches)
+    elif export_format == CallExportFormat.csv:
+        body = _stream_csv(batches)
+    else:
+        body = _stream_ndjson(batches)
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="calls-export.{export_format.value}"'},
+    )
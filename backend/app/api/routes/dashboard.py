@@ -1,38 +1,76 @@
-from fastapi import APIRouter
+from datetime import datetime, timedelta, timezone
 
-from backend.app.api.mock_data import AGENTS, ORGANIZATIONS, RECENT_SESSIONS, USAGE_BY_DAY
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from backend.app.api.mock_data import RECENT_SESSIONS
+from backend.app.core.settings import get_settings
+from backend.app.db import AgentRecord, OrganizationRecord, get_read_db
+from backend.app.response_cache import DASHBOARD_CACHE_TAG, cached_json_response
 from backend.app.schemas import AgentStatus, DashboardKpi, DashboardOverview, UsagePoint
+from backend.app.usage import usage_seconds_by_day
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+settings = get_settings()
+USAGE_WINDOW_DAYS = 7
+usage_points_adapter = TypeAdapter(list[UsagePoint])
 
 
-def _build_kpi() -> DashboardKpi:
-    total_clients = len(ORGANIZATIONS)
-    active_agents = sum(1 for agent in AGENTS if agent.status == AgentStatus.active)
-    total_minutes = sum(organization.monthly_minutes for organization in ORGANIZATIONS)
-    average_latency = round(
-        sum(agent.average_latency_ms for agent in AGENTS) / len(AGENTS)
-    )
-    healthy = all(agent.status != AgentStatus.error for agent in AGENTS)
+def _to_minutes(seconds: int) -> int:
+    return round(seconds / 60)
+
+
+def _build_kpi(db: Session) -> DashboardKpi:
+    agent_totals = db.execute(
+        select(
+            select(func.count(OrganizationRecord.id)).scalar_subquery(),
+            func.coalesce(func.sum(case((AgentRecord.status == AgentStatus.active.value, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((AgentRecord.status == AgentStatus.error.value, 1), else_=0)), 0),
+            func.avg(AgentRecord.average_latency_ms),
+        )
+    ).one()
+    month_start = datetime.now(timezone.utc).date().replace(day=1)
+    total_seconds = sum(usage_seconds_by_day(db, month_start).values())
+    total_clients, active_agents, errored_agents, average_latency = agent_totals
 
     return DashboardKpi(
         total_clients=total_clients,
         active_agents=active_agents,
-        total_minutes=total_minutes,
-        system_latency_ms=average_latency,
-        healthy=healthy,
+        total_minutes=_to_minutes(total_seconds),
+        system_latency_ms=round(average_latency or 0),
+        healthy=errored_agents == 0,
     )
 
 
+def _build_usage_by_day(db: Session) -> list[UsagePoint]:
+    today = datetime.now(timezone.utc).date()
+    days = [today - timedelta(days=offset) for offset in range(USAGE_WINDOW_DAYS - 1, -1, -1)]
+    seconds_by_day = usage_seconds_by_day(db, days[0])
+
+    return [UsagePoint(day=day.strftime("%a"), minutes=_to_minutes(seconds_by_day.get(day, 0))) for day in days]
+
+
 @router.get("/overview", response_model=DashboardOverview)
-def dashboard_overview() -> DashboardOverview:
-    return DashboardOverview(
-        kpi=_build_kpi(),
-        usage_by_day=USAGE_BY_DAY,
-        recent_sessions=RECENT_SESSIONS,
-    )
+def dashboard_overview(request: Request, db: Session = Depends(get_read_db)) -> Response:
+    def render() -> bytes:
+        overview = DashboardOverview(
+            kpi=_build_kpi(db),
+            usage_by_day=_build_usage_by_day(db),
+            recent_sessions=RECENT_SESSIONS,
+        )
+        return overview.model_dump_json(by_alias=True).encode("utf-8")
+
+    return cached_json_response(request, DASHBOARD_CACHE_TAG, "overview", settings.dashboard_cache_ttl_seconds, render)
 
 
 @router.get("/usage", response_model=list[UsagePoint])
-def dashboard_usage() -> list[UsagePoint]:
-    return USAGE_BY_DAY
+def dashboard_usage(request: Request, db: Session = Depends(get_read_db)) -> Response:
+    return cached_json_response(
+        request,
+        DASHBOARD_CACHE_TAG,
+        "usage",
+        settings.dashboard_cache_ttl_seconds,
+        lambda: usage_points_adapter.dump_json(_build_usage_by_day(db), by_alias=True),
+    )
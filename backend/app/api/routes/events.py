@@ -0,0 +1,33 @@
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from backend.app.core.settings import get_settings
+from backend.app.events import event_bus
+
+router = APIRouter(prefix="/events", tags=["events"])
+settings = get_settings()
+SSE_RETRY_FRAME = b"retry: 3000\n\n"
+SSE_HEARTBEAT_FRAME = b": keep-alive\n\n"
+
+
+async def _stream_events() -> AsyncIterator[bytes]:
+    with event_bus.subscribe() as queue:
+        yield SSE_RETRY_FRAME
+
+        while True:
+            try:
+                yield await asyncio.wait_for(queue.get(), timeout=settings.events_heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield SSE_HEARTBEAT_FRAME
+
+
+@router.get("")
+async def stream_events() -> StreamingResponse:
+    return StreamingResponse(
+        _stream_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,25 +1,87 @@
+from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 
-from backend.app.api.mock_data import ORGANIZATIONS
-from backend.app.schemas import Organization, SubscriptionStatus
+from backend.app.core.settings import get_settings
+from backend.app.db import AgentRecord, OrganizationRecord, UsageDailyRecord, get_read_db
+from backend.app.response_cache import ORGANIZATIONS_CACHE_TAG, cached_json_response
+from backend.app.schemas import AgentStatus, Organization, SubscriptionStatus
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
+settings = get_settings()
+organizations_adapter = TypeAdapter(list[Organization])
+
+
+def _list_organizations(
+    db: Session,
+    subscription_status: Optional[SubscriptionStatus],
+    limit: int,
+    offset: int,
+) -> list[Organization]:
+    month_start = datetime.now(timezone.utc).date().replace(day=1)
+    active_agents = (
+        select(func.count(AgentRecord.id))
+        .where(
+            AgentRecord.organization_id == OrganizationRecord.id,
+            AgentRecord.status == AgentStatus.active.value,
+        )
+        .scalar_subquery()
+    )
+    monthly_seconds = (
+        select(func.coalesce(func.sum(UsageDailyRecord.duration_seconds), 0))
+        .where(
+            UsageDailyRecord.organization_id == OrganizationRecord.id,
+            UsageDailyRecord.day >= month_start,
+        )
+        .scalar_subquery()
+    )
+    statement = select(
+        OrganizationRecord.organization_id,
+        OrganizationRecord.name,
+        OrganizationRecord.subscription_status,
+        active_agents,
+        monthly_seconds,
+    )
+
+    if subscription_status is not None:
+        statement = statement.where(OrganizationRecord.subscription_status == subscription_status.value)
+
+    rows = db.execute(statement.order_by(OrganizationRecord.id.asc()).offset(offset).limit(limit)).all()
+
+    return [
+        Organization(
+            id=organization_id,
+            name=name,
+            subscription_status=row_status,
+            active_agents=agent_count,
+            monthly_minutes=round(seconds / 60),
+        )
+        for organization_id, name, row_status, agent_count, seconds in rows
+    ]
 
 
 @router.get("", response_model=list[Organization])
 def list_organizations(
+    request: Request,
     subscription_status: Optional[SubscriptionStatus] = Query(
         default=None,
         alias="subscriptionStatus",
     ),
-) -> list[Organization]:
-    if subscription_status is None:
-        return ORGANIZATIONS
-
-    return [
-        organization
-        for organization in ORGANIZATIONS
-        if organization.subscription_status == subscription_status
-    ]
+    limit: int = Query(default=100, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_read_db),
+) -> Response:
+    return cached_json_response(
+        request,
+        ORGANIZATIONS_CACHE_TAG,
+        f"list:{subscription_status.value if subscription_status else ''}:{limit}:{offset}",
+        settings.organizations_cache_ttl_seconds,
+        lambda: organizations_adapter.dump_json(
+            _list_organizations(db, subscription_status, limit, offset),
+            by_alias=True,
+        ),
+    )
@@ -2,11 +2,20 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, select
 from sqlalchemy.orm import Session
 
 from backend.app.api import mock_data
-from backend.app.db import PlatformSettingsRecord, SettingsAuditRecord, get_db
+from backend.app.audit import SettingsAuditDraft, record_settings_audit
+from backend.app.db import (
+    PlatformSettingsRecord,
+    SettingsAuditFieldRecord,
+    SettingsAuditRecord,
+    get_db,
+    get_read_db,
+    normalize_actor,
+)
+from backend.app.platform_settings import platform_settings_cache
 from backend.app.schemas import (
     PlatformSettings,
     PlatformSettingsAuditEntry,
@@ -105,41 +114,35 @@ def _audit_record_to_schema(record: SettingsAuditRecord) -> PlatformSettingsAudi
     )
 
 
-def _filter_history_entries(
-    db: Session,
+def _history_conditions(
     actor: Optional[str],
     changed_field: Optional[str],
     from_ts: Optional[datetime],
     to_ts: Optional[datetime],
-) -> list[PlatformSettingsAuditEntry]:
-    rows = db.query(SettingsAuditRecord).order_by(desc(SettingsAuditRecord.changed_at)).all()
-    normalized_actor = actor.strip().lower() if actor else None
+) -> list:
+    conditions = []
+    normalized_actor = normalize_actor(actor) if actor else None
     normalized_changed_field = changed_field.strip().lower() if changed_field else None
-    entries: list[PlatformSettingsAuditEntry] = []
 
-    for row in rows:
-        entry = _audit_record_to_schema(row)
+    if normalized_actor:
+        conditions.append(SettingsAuditRecord.actor_normalized == normalized_actor)
 
-        if normalized_actor and entry.actor.strip().lower() != normalized_actor:
-            continue
-
-        if normalized_changed_field and not any(
-            field.strip().lower() == normalized_changed_field
-            for field in entry.changed_fields
-        ):
-            continue
-
-        changed_at_ts = _parse_history_timestamp(entry.changed_at)
-
-        if from_ts and changed_at_ts < from_ts:
-            continue
+    if normalized_changed_field:
+        conditions.append(
+            SettingsAuditRecord.event_id.in_(
+                select(SettingsAuditFieldRecord.event_id).where(
+                    SettingsAuditFieldRecord.field_normalized == normalized_changed_field
+                )
+            )
+        )
 
-        if to_ts and changed_at_ts > to_ts:
-            continue
+    if from_ts:
+        conditions.append(SettingsAuditRecord.changed_at >= from_ts)
 
-        entries.append(entry)
+    if to_ts:
+        conditions.append(SettingsAuditRecord.changed_at <= to_ts)
 
-    return entries
+    return conditions
 
 
 @router.get("", response_model=PlatformSettings)
@@ -160,7 +163,7 @@ def get_platform_settings_history(
     to_date: Optional[str] = Query(default=None, alias="toDate"),
     changed_field: Optional[str] = Query(default=None, alias="changedField"),
     _: str = Depends(require_roles(["admin", "editor", "viewer"])),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> list[PlatformSettingsAuditEntry]:
     from_ts = _parse_history_timestamp(from_date) if from_date else None
     to_ts = _parse_history_timestamp(to_date) if to_date else None
@@ -171,9 +174,16 @@ def get_platform_settings_history(
             detail="fromDate must be less than or equal to toDate",
         )
 
-    entries = _filter_history_entries(db, actor, changed_field, from_ts, to_ts)
+    rows = (
+        db.query(SettingsAuditRecord)
+        .filter(*_history_conditions(actor, changed_field, from_ts, to_ts))
+        .order_by(desc(SettingsAuditRecord.changed_at), desc(SettingsAuditRecord.id))
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
 
-    return entries[offset : offset + limit]
+    return [_audit_record_to_schema(row) for row in rows]
 
 
 @router.get("/history/meta", response_model=PlatformSettingsHistoryMeta)
@@ -181,7 +191,7 @@ def get_platform_settings_history_meta(
     from_date: Optional[str] = Query(default=None, alias="fromDate"),
     to_date: Optional[str] = Query(default=None, alias="toDate"),
     _: str = Depends(require_roles(["admin", "editor", "viewer"])),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> PlatformSettingsHistoryMeta:
     from_ts = _parse_history_timestamp(from_date) if from_date else None
     to_ts = _parse_history_timestamp(to_date) if to_date else None
@@ -192,27 +202,31 @@ def get_platform_settings_history_meta(
             detail="fromDate must be less than or equal to toDate",
         )
 
-    entries = _filter_history_entries(
-        db,
-        actor=None,
-        changed_field=None,
-        from_ts=from_ts,
-        to_ts=to_ts,
+    conditions = _history_conditions(actor=None, changed_field=None, from_ts=from_ts, to_ts=to_ts)
+    total_entries, earliest_changed_at, latest_changed_at = (
+        db.query(
+            func.count(SettingsAuditRecord.id),
+            func.min(SettingsAuditRecord.changed_at),
+            func.max(SettingsAuditRecord.changed_at),
+        )
+        .filter(*conditions)
+        .one()
+    )
+    actors = db.query(SettingsAuditRecord.actor).filter(*conditions).distinct().all()
+    changed_fields = (
+        db.query(SettingsAuditFieldRecord.field_name)
+        .join(SettingsAuditRecord, SettingsAuditRecord.event_id == SettingsAuditFieldRecord.event_id)
+        .filter(*conditions)
+        .distinct()
+        .all()
     )
-
-    actor_set = {entry.actor for entry in entries}
-    changed_field_set = {
-        changed_field
-        for entry in entries
-        for changed_field in entry.changed_fields
-    }
 
     return PlatformSettingsHistoryMeta(
-        actors=sorted(actor_set),
-        changed_fields=sorted(changed_field_set),
-        total_entries=len(entries),
-        earliest_changed_at=entries[-1].changed_at if entries else None,
-        latest_changed_at=entries[0].changed_at if entries else None,
+        actors=sorted(actor for (actor,) in actors),
+        changed_fields=sorted(field for (field,) in changed_fields),
+        total_entries=total_entries,
+        earliest_changed_at=_to_iso_utc(earliest_changed_at) if earliest_changed_at else None,
+        latest_changed_at=_to_iso_utc(latest_changed_at) if latest_changed_at else None,
     )
 
 
@@ -247,19 +261,15 @@ def update_platform_settings(
             setattr(record, field, normalized_updates[field])
 
         record.updated_at = datetime.now(timezone.utc)
+        record.version = PlatformSettingsRecord.version + 1
 
-        next_entry_id = f"settings-audit-{(db.query(func.count(SettingsAuditRecord.id)).scalar() or 0) + 1}"
-        db.add(
-            SettingsAuditRecord(
-                event_id=next_entry_id,
-                changed_at=datetime.now(timezone.utc),
-                actor=actor,
-                reason=normalized_reason,
-                changed_fields=[_to_camel(field) for field in changed_fields],
-            )
+        record_settings_audit(
+            db,
+            [SettingsAuditDraft(actor, normalized_reason, [_to_camel(field) for field in changed_fields])],
         )
         db.add(record)
         db.commit()
         db.refresh(record)
+        platform_settings_cache.store(record)
 
     return _settings_record_to_schema(record)
@@ -1,25 +1,62 @@
+import asyncio
+import json
 import logging
+import re
+import time
 from base64 import b64decode
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
 from uuid import uuid4
 from xml.sax.saxutils import escape
 
-import httpx
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response, status
-from sqlalchemy.exc import IntegrityError
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-
+from starlette.concurrency import run_in_threadpool
+
+from backend.app.agent_config import AgentConfig, agent_configs
+from backend.app.agent_routing import agent_routes
+from backend.app.api.routes.calls import call_session_to_schema
+from backend.app.audio import (
+    AudioBlob,
+    SynthesisCache,
+    build_audio_response,
+    build_audio_store,
+    normalize_synthesis_text,
+    synthesis_cache_key,
+)
+from backend.app.call_sessions import upsert_call_session
+from backend.app.callback_buffer import RECORDING_CALLBACK, STATUS_CALLBACK, CallbackBuffer, CallUpdate
 from backend.app.core.settings import get_settings
-from backend.app.db import AgentRecord, CallSessionRecord, PlatformSettingsRecord, get_db
+from backend.app.db import (
+    CallSessionRecord,
+    SessionLocal,
+    get_db,
+    normalize_agent_name,
+)
+from backend.app.events import CALL_CREATED_EVENT, CALL_STATUS_CHANGED_EVENT, event_bus
+from backend.app.ids import allocate_external_id
+from backend.app.platform_settings import platform_settings_cache
+from backend.app.providers.http import OPENAI_PROVIDER, RIME_PROVIDER, get_provider_client
+from backend.app.response_cache import DASHBOARD_CACHE_TAG, ORGANIZATIONS_CACHE_TAG, response_cache
+from backend.app.security import require_roles
+from backend.app.usage import UsageKey, add_call_duration, apply_usage_deltas, record_call_duration
 
 router = APIRouter(prefix="/twilio", tags=["twilio"])
-AUDIO_CACHE_TTL_MINUTES = 20
 RIME_MODEL_ID = "mist"
 RIME_FALLBACK_VOICE = "allison"
-audio_cache: dict[str, dict[str, object]] = {}
+STREAM_MIN_SENTENCE_CHARS = 12
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+")
+PROGRESSIVE_AUDIO_MEDIA_TYPES = frozenset({"audio/mpeg"})
+CALLBACK_FLUSH_BATCH_SIZE = 500
+T = TypeVar("T")
 logger = logging.getLogger("uvicorn.error")
 runtime_settings = get_settings()
+synthesis_cache = SynthesisCache(
+    max_bytes=runtime_settings.tts_cache_max_bytes,
+    disk_dir=runtime_settings.tts_cache_dir,
+)
+audio_store = build_audio_store(runtime_settings)
 
 
 def _normalize_secret(value: str) -> str:
@@ -40,31 +77,22 @@ def _resolve_provider_key(settings_value: str, env_value: str) -> str:
     return _normalize_secret(env_value)
 
 
-def _normalize_phone(value: str) -> str:
-    return "".join(char for char in value if char.isdigit())
-
-
-def _load_agents(db: Session) -> list[AgentRecord]:
-    return db.query(AgentRecord).order_by(AgentRecord.id.asc()).all()
+def _match_agent_by_number(db: Session, to_number: str) -> AgentConfig:
+    agent_pk = agent_routes.resolve(db, to_number)
+    agent = agent_configs.get(db, agent_pk) if agent_pk is not None else None
 
+    if agent is None and agent_pk is not None:
+        agent_routes.invalidate()
+        agent_pk = agent_routes.resolve(db, to_number)
+        agent = agent_configs.get(db, agent_pk) if agent_pk is not None else None
 
-def _match_agent_by_number(db: Session, to_number: str) -> AgentRecord:
-    agents = _load_agents(db)
-
-    if not agents:
+    if agent is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="No agents configured",
         )
 
-    normalized_to = _normalize_phone(to_number)
-
-    for agent in agents:
-        if _normalize_phone(agent.twilio_number) == normalized_to:
-            return agent
-
-    first_active = next((agent for agent in agents if agent.status == "active"), None)
-    return first_active if first_active else agents[0]
+    return agent
 
 
 def _twilio_status_to_domain(call_status: str) -> str:
@@ -82,51 +110,26 @@ def _twilio_status_to_domain(call_status: str) -> str:
     return "busy"
 
 
-def _next_call_id(db: Session) -> str:
-    numeric_ids: list[int] = []
-
-    for row in db.query(CallSessionRecord.call_id).all():
-        call_id = row[0]
-
-        if not isinstance(call_id, str):
-            continue
-
-        try:
-            numeric_ids.append(int(call_id.split("-")[-1]))
-        except ValueError:
-            continue
+async def _call_audio_store(method: Callable[..., T], *args: object) -> T:
+    if audio_store.blocking:
+        return await run_in_threadpool(method, *args)
 
-    next_id = (max(numeric_ids) if numeric_ids else 0) + 1
-    return f"call-{next_id}"
+    return method(*args)
 
 
-def _cleanup_audio_cache() -> None:
-    now = datetime.now(timezone.utc)
-    expired_ids = []
-
-    for audio_id, payload in audio_cache.items():
-        created_at = payload.get("created_at")
+async def _store_audio_blob(blob: AudioBlob, audio_id: Optional[str] = None) -> str:
+    audio_id = audio_id or uuid4().hex
+    await _call_audio_store(audio_store.put, audio_id, blob)
+    return audio_id
 
-        if not isinstance(created_at, datetime):
-            expired_ids.append(audio_id)
-            continue
 
-        if now - created_at > timedelta(minutes=AUDIO_CACHE_TTL_MINUTES):
-            expired_ids.append(audio_id)
+async def _wait_for_pending_audio(audio_id: str) -> Optional[AudioBlob]:
+    deadline = time.monotonic() + runtime_settings.audio_store_pending_wait_seconds
 
-    for audio_id in expired_ids:
-        audio_cache.pop(audio_id, None)
+    while time.monotonic() < deadline and await _call_audio_store(audio_store.is_pending, audio_id):
+        await asyncio.sleep(0.1)
 
-
-def _store_audio_blob(audio_bytes: bytes, media_type: str) -> str:
-    _cleanup_audio_cache()
-    audio_id = uuid4().hex
-    audio_cache[audio_id] = {
-        "bytes": audio_bytes,
-        "media_type": media_type,
-        "created_at": datetime.now(timezone.utc),
-    }
-    return audio_id
+    return await _call_audio_store(audio_store.get, audio_id)
 
 
 def _resolve_voice_name(voice_id: str) -> str:
@@ -138,11 +141,7 @@ def _resolve_voice_name(voice_id: str) -> str:
     return value or RIME_FALLBACK_VOICE
 
 
-def _load_platform_settings(db: Session) -> Optional[PlatformSettingsRecord]:
-    return db.query(PlatformSettingsRecord).first()
-
-
-def _generate_greeting_text(
+async def _generate_greeting_text(
     agent_name: str,
     caller_number: str,
     prompt: str,
@@ -166,24 +165,24 @@ def _generate_greeting_text(
     )
 
     try:
-        with httpx.Client(timeout=12.0) as client:
-            response = client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {safe_key}",
-                    "X-API-Key": safe_key,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": model or "gpt-4.1-mini",
-                    "messages": [
-                        {"role": "system", "content": prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    "temperature": 0.4,
-                    "max_tokens": 80,
-                },
-            )
+        response = await get_provider_client(OPENAI_PROVIDER).post(
+            "/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {safe_key}",
+                "X-API-Key": safe_key,
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": model or "gpt-4.1-mini",
+                "messages": [
+                    {"role": "system", "content": prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "temperature": 0.4,
+                "max_tokens": 80,
+            },
+            timeout=12.0,
+        )
 
         response.raise_for_status()
         payload = response.json()
@@ -199,7 +198,22 @@ def _generate_greeting_text(
         return fallback, "fallback-openai-error"
 
 
-def _generate_reply_text(
+def _reply_fallback_text(caller_text: str) -> str:
+    return (
+        f"Thanks for sharing. I understood that you said: {caller_text[:80]}. "
+        "I will pass this to the team so they can follow up quickly."
+    )
+
+
+def _reply_user_prompt(caller_text: str) -> str:
+    return (
+        "Respond as a phone assistant in at most 2 concise sentences. "
+        "Acknowledge the caller request and give a clear next step. "
+        f"Caller message: {caller_text}"
+    )
+
+
+async def _generate_reply_text(
     agent_name: str,
     caller_text: str,
     prompt: str,
@@ -211,41 +225,33 @@ def _generate_reply_text(
     if not normalized_caller_text:
         return "I did not catch that clearly. Could you call again so I can assist you better?", "fallback-empty-speech"
 
-    fallback = (
-        f"Thanks for sharing. I understood that you said: {normalized_caller_text[:80]}. "
-        "I will pass this to the team so they can follow up quickly."
-    )
-
+    fallback = _reply_fallback_text(normalized_caller_text)
     safe_key = _normalize_secret(openai_api_key)
 
     if not safe_key:
         return fallback, "fallback-missing-openai-key"
 
-    user_prompt = (
-        "Respond as a phone assistant in at most 2 concise sentences. "
-        "Acknowledge the caller request and give a clear next step. "
-        f"Caller message: {normalized_caller_text}"
-    )
+    user_prompt = _reply_user_prompt(normalized_caller_text)
 
     try:
-        with httpx.Client(timeout=12.0) as client:
-            response = client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {safe_key}",
-                    "X-API-Key": safe_key,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": model or "gpt-4.1-mini",
-                    "messages": [
-                        {"role": "system", "content": prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    "temperature": 0.4,
-                    "max_tokens": 120,
-                },
-            )
+        response = await get_provider_client(OPENAI_PROVIDER).post(
+            "/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {safe_key}",
+                "X-API-Key": safe_key,
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": model or "gpt-4.1-mini",
+                "messages": [
+                    {"role": "system", "content": prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "temperature": 0.4,
+                "max_tokens": 120,
+            },
+            timeout=12.0,
+        )
 
         response.raise_for_status()
         payload = response.json()
@@ -261,54 +267,329 @@ def _generate_reply_text(
         return fallback, "fallback-openai-error"
 
 
-def _synthesize_rime_audio(
+def _split_complete_sentences(buffer: str) -> tuple[list[str], str]:
+    parts = SENTENCE_BOUNDARY_PATTERN.split(buffer)
+    remainder = parts.pop()
+    sentences: list[str] = []
+    pending = ""
+
+    for part in parts:
+        pending = f"{pending} {part.strip()}".strip()
+
+        if len(pending) >= STREAM_MIN_SENTENCE_CHARS:
+            sentences.append(pending)
+            pending = ""
+
+    if pending:
+        remainder = f"{pending} {remainder}" if remainder else pending
+
+    return sentences, remainder
+
+
+async def _stream_reply_sentences(
+    caller_text: str,
+    prompt: str,
+    model: str,
+    openai_api_key: str,
+) -> AsyncIterator[str]:
+    safe_key = _normalize_secret(openai_api_key)
+    buffer = ""
+
+    async with get_provider_client(OPENAI_PROVIDER).stream(
+        "POST",
+        "/v1/chat/completions",
+        headers={
+            "Authorization": f"Bearer {safe_key}",
+            "X-API-Key": safe_key,
+            "Content-Type": "application/json",
+        },
+        json={
+            "model": model or "gpt-4.1-mini",
+            "messages": [
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": _reply_user_prompt(caller_text)},
+            ],
+            "temperature": 0.4,
+            "max_tokens": 120,
+            "stream": True,
+        },
+        timeout=12.0,
+    ) as response:
+        response.raise_for_status()
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+
+            data = line.removeprefix("data:").strip()
+
+            if data == "[DONE]":
+                break
+
+            delta = (
+                json.loads(data).get("choices", [{}])[0]
+                .get("delta", {})
+                .get("content")
+            )
+            buffer += delta or ""
+            sentences, buffer = _split_complete_sentences(buffer)
+
+            for sentence in sentences:
+                yield sentence
+
+    if buffer.strip():
+        yield buffer.strip()
+
+
+async def _load_cached_synthesis(cache_key: str) -> Optional[AudioBlob]:
+    cached = synthesis_cache.get(cache_key)
+
+    if cached is None and synthesis_cache.disk_enabled:
+        cached = await run_in_threadpool(synthesis_cache.load_from_disk, cache_key)
+
+    return cached
+
+
+async def _remember_synthesis(cache_key: str, audio_bytes: bytes, media_type: str) -> AudioBlob:
+    if synthesis_cache.disk_enabled:
+        return await run_in_threadpool(synthesis_cache.put, cache_key, audio_bytes, media_type)
+
+    return synthesis_cache.put(cache_key, audio_bytes, media_type)
+
+
+async def _synthesize_rime_audio(
     text: str,
     voice_name: str,
     rime_api_key: str,
-) -> tuple[Optional[tuple[bytes, str]], str]:
+) -> tuple[Optional[AudioBlob], str]:
     safe_key = _normalize_secret(rime_api_key)
 
     if not safe_key:
         return None, "fallback-missing-rime-key"
 
+    normalized_text = normalize_synthesis_text(text)
     candidates = [voice_name.strip().lower(), RIME_FALLBACK_VOICE]
     seen: set[str] = set()
 
-    with httpx.Client(timeout=18.0) as client:
-        for candidate in candidates:
-            if not candidate or candidate in seen:
+    client = get_provider_client(RIME_PROVIDER)
+
+    for candidate in candidates:
+        if not candidate or candidate in seen:
+            continue
+
+        seen.add(candidate)
+        cache_key = synthesis_cache_key(candidate, RIME_MODEL_ID, normalized_text)
+        cached = await _load_cached_synthesis(cache_key)
+
+        if cached is not None:
+            return cached, "rime-cache"
+
+        try:
+            response = await client.post(
+                "/v1/rime-tts",
+                headers={
+                    "Authorization": f"Bearer {safe_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "speaker": candidate,
+                    "text": normalized_text,
+                    "modelId": RIME_MODEL_ID,
+                },
+                timeout=18.0,
+            )
+            response.raise_for_status()
+            content_type = (response.headers.get("content-type") or "").lower()
+
+            if "audio" in content_type:
+                return await _remember_synthesis(cache_key, response.content, content_type.split(";")[0]), "rime"
+
+            json_payload = response.json()
+            encoded_audio = json_payload.get("audioContent") or json_payload.get("audio")
+
+            if isinstance(encoded_audio, str) and encoded_audio.strip():
+                return await _remember_synthesis(cache_key, b64decode(encoded_audio), "audio/mpeg"), "rime"
+        except Exception:
+            continue
+
+    return None, "fallback-rime-error"
+
+
+class ReplyAudioStream:
+    """Reply audio that grows sentence by sentence; only MP3 is served before the reply is finished."""
+
+    def __init__(self) -> None:
+        self.blobs: list[AudioBlob] = []
+        self.media_type = ""
+        self.sentences: list[str] = []
+        self.text_provider = "openai-stream"
+        self.audio_provider = "rime"
+        self.finished = False
+        self._changed = asyncio.Event()
+
+    def append_audio(self, blob: AudioBlob) -> bool:
+        if self.media_type and blob.media_type != self.media_type:
+            return False
+
+        self.media_type = blob.media_type
+        self.blobs.append(blob)
+        self._notify()
+        return True
+
+    def finish(self) -> None:
+        self.finished = True
+        self._notify()
+
+    @property
+    def progressive(self) -> bool:
+        return self.media_type in PROGRESSIVE_AUDIO_MEDIA_TYPES
+
+    async def wait_for_first_chunk(self) -> bool:
+        while not (self.blobs and self.progressive) and not self.finished:
+            await self._changed.wait()
+
+        return bool(self.blobs)
+
+    async def wait_until_finished(self) -> None:
+        while not self.finished:
+            await self._changed.wait()
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        index = 0
+
+        while True:
+            while index < len(self.blobs):
+                yield self.blobs[index].data
+                index += 1
+
+            if self.finished:
+                return
+
+            await self._changed.wait()
+
+    def _notify(self) -> None:
+        changed = self._changed
+        self._changed = asyncio.Event()
+        changed.set()
+
+
+async def _synthesize_whole_reply(reply_stream: ReplyAudioStream, voice_name: str, rime_api_key: str) -> None:
+    audio_blob, audio_provider = await _synthesize_rime_audio(
+        " ".join(reply_stream.sentences), voice_name, rime_api_key
+    )
+    reply_stream.blobs = [audio_blob] if audio_blob is not None else []
+
+    if audio_blob is None:
+        reply_stream.audio_provider = audio_provider
+    else:
+        reply_stream.media_type = audio_blob.media_type
+
+
+audio_streams: dict[str, ReplyAudioStream] = {}
+_pipeline_tasks: set[asyncio.Task] = set()
+
+
+async def _run_reply_pipeline(
+    audio_id: str,
+    reply_stream: ReplyAudioStream,
+    sentences: AsyncIterator[str],
+    fallback_text: str,
+    voice_name: str,
+    rime_api_key: str,
+) -> None:
+    pending_syntheses: asyncio.Queue = asyncio.Queue()
+
+    def _schedule(sentence: str) -> None:
+        reply_stream.sentences.append(sentence)
+        pending_syntheses.put_nowait(
+            asyncio.create_task(_synthesize_rime_audio(sentence, voice_name, rime_api_key))
+        )
+
+    async def _produce() -> None:
+        try:
+            async for sentence in sentences:
+                _schedule(sentence)
+        except Exception:
+            reply_stream.text_provider = "fallback-openai-error"
+
+        if not reply_stream.sentences:
+            _schedule(fallback_text)
+
+        pending_syntheses.put_nowait(None)
+
+    producer = asyncio.create_task(_produce())
+
+    try:
+        while True:
+            synthesis = await pending_syntheses.get()
+
+            if synthesis is None:
+                break
+
+            audio_blob, audio_provider = await synthesis
+
+            if audio_blob is None:
+                reply_stream.audio_provider = audio_provider
                 continue
 
-            seen.add(candidate)
-
-            try:
-                response = client.post(
-                    "https://users.rime.ai/v1/rime-tts",
-                    headers={
-                        "Authorization": f"Bearer {safe_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "speaker": candidate,
-                        "text": text,
-                        "modelId": RIME_MODEL_ID,
-                    },
+            if not reply_stream.append_audio(audio_blob):
+                logger.warning(
+                    "twilio.stream dropped sentence audio with mismatched media_type=%s",
+                    audio_blob.media_type,
                 )
-                response.raise_for_status()
-                content_type = (response.headers.get("content-type") or "").lower()
+    finally:
+        await producer
 
-                if "audio" in content_type:
-                    return (response.content, content_type.split(";")[0]), "rime"
+        if len(reply_stream.blobs) > 1 and not reply_stream.progressive:
+            await _synthesize_whole_reply(reply_stream, voice_name, rime_api_key)
 
-                json_payload = response.json()
-                encoded_audio = json_payload.get("audioContent") or json_payload.get("audio")
+        reply_stream.finish()
 
-                if isinstance(encoded_audio, str) and encoded_audio.strip():
-                    return (b64decode(encoded_audio), "audio/mpeg"), "rime"
-            except Exception:
-                continue
+        if len(reply_stream.blobs) == 1:
+            await _store_audio_blob(reply_stream.blobs[0], audio_id)
+        elif reply_stream.blobs:
+            joined_audio = b"".join(blob.data for blob in reply_stream.blobs)
+            await _store_audio_blob(
+                AudioBlob(key=audio_id, data=joined_audio, media_type=reply_stream.media_type),
+                audio_id,
+            )
 
-    return None, "fallback-rime-error"
+        audio_streams.pop(audio_id, None)
+
+
+async def _start_reply_stream(
+    agent: AgentConfig,
+    caller_text: str,
+    openai_api_key: str,
+    rime_api_key: str,
+) -> tuple[str, ReplyAudioStream]:
+    normalized_caller_text = caller_text.strip()
+    audio_id = uuid4().hex
+    reply_stream = ReplyAudioStream()
+    audio_streams[audio_id] = reply_stream
+
+    if audio_store.shared:
+        await _call_audio_store(audio_store.mark_pending, audio_id)
+
+    task = asyncio.create_task(
+        _run_reply_pipeline(
+            audio_id,
+            reply_stream,
+            _stream_reply_sentences(
+                caller_text=normalized_caller_text,
+                prompt=agent.prompt,
+                model=agent.model,
+                openai_api_key=openai_api_key,
+            ),
+            _reply_fallback_text(normalized_caller_text),
+            _resolve_voice_name(agent.voice_id),
+            rime_api_key,
+        )
+    )
+    _pipeline_tasks.add(task)
+    task.add_done_callback(_pipeline_tasks.discard)
+
+    return audio_id, reply_stream
 
 
 def _public_url_for(request: Request, route_name: str, **path_params: str) -> str:
@@ -324,39 +605,8 @@ def _public_url_for(request: Request, route_name: str, **path_params: str) -> st
     return raw_url
 
 
-@router.post("/voice")
-def inbound_voice_webhook(
-    request: Request,
-    call_sid: str = Form(alias="CallSid"),
-    from_number: str = Form(alias="From"),
-    to_number: str = Form(alias="To"),
-    db: Session = Depends(get_db),
-) -> Response:
-    agent = _match_agent_by_number(db, to_number)
-    existing = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).first()
-
-    if existing is None:
-        db.add(
-            CallSessionRecord(
-                call_id=_next_call_id(db),
-                call_sid=call_sid,
-                agent_name=agent.name,
-                caller_number=from_number,
-                started_at=datetime.now(timezone.utc),
-                duration_seconds=0,
-                status="busy",
-                sentiment="neutral",
-                recording_url="",
-                updated_at=datetime.now(timezone.utc),
-            )
-        )
-        try:
-            db.commit()
-        except IntegrityError:
-            db.rollback()
-
-    gather_url = _public_url_for(request, "voice_gather_webhook")
-    platform_settings = _load_platform_settings(db)
+def _resolve_provider_keys(db: Session) -> tuple[str, str]:
+    platform_settings = platform_settings_cache.get(db)
     openai_key = _resolve_provider_key(
         platform_settings.openai_api_key if platform_settings else "",
         runtime_settings.openai_api_key,
@@ -366,14 +616,96 @@ def inbound_voice_webhook(
         runtime_settings.rime_api_key,
     )
 
-    greeting_text, text_provider = _generate_greeting_text(
+    return openai_key, rime_key
+
+
+def _publish_call_event(event_type: str, call_session: CallSessionRecord) -> None:
+    event_bus.publish(event_type, call_session_to_schema(call_session).model_dump(by_alias=True, mode="json"))
+
+
+def _ensure_call_session(
+    db: Session,
+    call_sid: str,
+    from_number: str,
+    agent: AgentConfig,
+    sentiment: Optional[str] = None,
+    expect_new_call: bool = False,
+) -> CallSessionRecord:
+    now = datetime.now(timezone.utc)
+    changes = {"sentiment": sentiment, "updated_at": now} if sentiment is not None else {}
+    values = {}
+
+    if expect_new_call:
+        # Drawing the id up front keeps a new call to one upsert; a retried webhook burns one value.
+        values["call_id"] = allocate_external_id(db, "call")
+
+    call_session, created = upsert_call_session(
+        db,
+        {
+            **values,
+            "call_sid": call_sid,
+            "agent_name": agent.name,
+            "agent_name_normalized": normalize_agent_name(agent.name),
+            "organization_id": agent.organization_id,
+            "caller_number": from_number,
+            "started_at": now,
+            "duration_seconds": 0,
+            "status": "busy",
+            "sentiment": sentiment or "neutral",
+            "recording_url": "",
+            "updated_at": now,
+        },
+        changes,
+    )
+    db.commit()
+
+    if created:
+        _publish_call_event(CALL_CREATED_EVENT, call_session)
+
+    return call_session
+
+
+def _prepare_call_turn(
+    db: Session,
+    call_sid: str,
+    from_number: str,
+    to_number: str,
+    sentiment: Optional[str] = None,
+    expect_new_call: bool = False,
+) -> tuple[AgentConfig, CallSessionRecord, str, str]:
+    agent = _match_agent_by_number(db, to_number)
+    call_session = _ensure_call_session(db, call_sid, from_number, agent, sentiment, expect_new_call)
+    openai_key, rime_key = _resolve_provider_keys(db)
+
+    return agent, call_session, openai_key, rime_key
+
+
+@router.post("/voice")
+async def inbound_voice_webhook(
+    request: Request,
+    call_sid: str = Form(alias="CallSid"),
+    from_number: str = Form(alias="From"),
+    to_number: str = Form(alias="To"),
+    db: Session = Depends(get_db),
+) -> Response:
+    agent, _, openai_key, rime_key = await run_in_threadpool(
+        _prepare_call_turn,
+        db,
+        call_sid,
+        from_number,
+        to_number,
+        expect_new_call=True,
+    )
+    gather_url = _public_url_for(request, "voice_gather_webhook")
+
+    greeting_text, text_provider = await _generate_greeting_text(
         agent_name=agent.name,
         caller_number=from_number,
         prompt=agent.prompt,
         model=agent.model,
         openai_api_key=openai_key,
     )
-    audio_blob, audio_provider = _synthesize_rime_audio(
+    audio_blob, audio_provider = await _synthesize_rime_audio(
         text=greeting_text,
         voice_name=_resolve_voice_name(agent.voice_id),
         rime_api_key=rime_key,
@@ -391,8 +723,7 @@ def inbound_voice_webhook(
     intro = ""
 
     if audio_blob:
-        audio_bytes, media_type = audio_blob
-        audio_id = _store_audio_blob(audio_bytes, media_type)
+        audio_id = await _store_audio_blob(audio_blob)
         audio_url = _public_url_for(request, "twilio_audio_file", audio_id=audio_id)
         intro = f"<Play>{audio_url}</Play>"
     else:
@@ -414,24 +745,36 @@ def inbound_voice_webhook(
 
 
 @router.get("/audio/{audio_id}", name="twilio_audio_file")
-def twilio_audio_file(audio_id: str) -> Response:
-    _cleanup_audio_cache()
-    payload = audio_cache.get(audio_id)
+async def twilio_audio_file(audio_id: str, request: Request) -> Response:
+    reply_stream = audio_streams.get(audio_id)
+
+    if reply_stream is not None:
+        return StreamingResponse(
+            reply_stream.iter_chunks(),
+            media_type=reply_stream.media_type,
+            headers={"Cache-Control": "no-store"},
+        )
 
-    if payload is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audio not found")
+    blob = await _call_audio_store(audio_store.get, audio_id)
 
-    audio_bytes = payload.get("bytes")
-    media_type = payload.get("media_type", "audio/mpeg")
+    if blob is None and audio_store.shared:
+        blob = await _wait_for_pending_audio(audio_id)
 
-    if not isinstance(audio_bytes, (bytes, bytearray)):
+    if blob is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audio not found")
 
-    return Response(content=bytes(audio_bytes), media_type=str(media_type))
+    return build_audio_response(blob, request.headers, int(audio_store.ttl_seconds))
+
+
+@router.get("/audio-store/stats")
+def twilio_audio_store_stats(
+    _: str = Depends(require_roles(["admin", "editor", "viewer"])),
+) -> dict[str, int]:
+    return audio_store.stats()
 
 
 @router.post("/gather", name="voice_gather_webhook")
-def voice_gather_webhook(
+async def voice_gather_webhook(
     request: Request,
     call_sid: str = Form(alias="CallSid"),
     from_number: str = Form(alias="From"),
@@ -440,73 +783,66 @@ def voice_gather_webhook(
     db: Session = Depends(get_db),
 ) -> Response:
     voice_finish_url = _public_url_for(request, "voice_finish_webhook")
-    existing = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).first()
+    has_speech = bool(speech_result.strip())
+    # The turn's sentiment rides on the session upsert, so the turn costs one write.
+    agent, _, openai_key, rime_key = await run_in_threadpool(
+        _prepare_call_turn,
+        db,
+        call_sid,
+        from_number,
+        to_number,
+        "positive" if has_speech else "neutral",
+    )
 
-    if existing is None:
-        db.add(
-            CallSessionRecord(
-                call_id=_next_call_id(db),
-                call_sid=call_sid,
-                agent_name=_match_agent_by_number(db, to_number).name,
-                caller_number=from_number,
-                started_at=datetime.now(timezone.utc),
-                duration_seconds=0,
-                status="busy",
-                sentiment="neutral",
-                recording_url="",
-                updated_at=datetime.now(timezone.utc),
-            )
+    started = time.perf_counter()
+    audio_url = ""
+
+    if (
+        runtime_settings.twilio_streaming_replies_enabled
+        and has_speech
+        and _normalize_secret(openai_key)
+        and _normalize_secret(rime_key)
+    ):
+        audio_id, reply_stream = await _start_reply_stream(agent, speech_result, openai_key, rime_key)
+
+        if await reply_stream.wait_for_first_chunk():
+            audio_url = _public_url_for(request, "twilio_audio_file", audio_id=audio_id)
+        else:
+            await reply_stream.wait_until_finished()
+
+        reply_text = " ".join(reply_stream.sentences)
+        text_provider = reply_stream.text_provider
+        audio_provider = reply_stream.audio_provider
+    else:
+        reply_text, text_provider = await _generate_reply_text(
+            agent_name=agent.name,
+            caller_text=speech_result,
+            prompt=agent.prompt,
+            model=agent.model,
+            openai_api_key=openai_key,
+        )
+        audio_blob, audio_provider = await _synthesize_rime_audio(
+            text=reply_text,
+            voice_name=_resolve_voice_name(agent.voice_id),
+            rime_api_key=rime_key,
         )
-        try:
-            db.commit()
-        except IntegrityError:
-            db.rollback()
-        existing = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).first()
-
-    agent = _match_agent_by_number(db, to_number)
-    platform_settings = _load_platform_settings(db)
-    openai_key = _resolve_provider_key(
-        platform_settings.openai_api_key if platform_settings else "",
-        runtime_settings.openai_api_key,
-    )
-    rime_key = _resolve_provider_key(
-        platform_settings.rime_api_key if platform_settings else "",
-        runtime_settings.rime_api_key,
-    )
 
-    reply_text, text_provider = _generate_reply_text(
-        agent_name=agent.name,
-        caller_text=speech_result,
-        prompt=agent.prompt,
-        model=agent.model,
-        openai_api_key=openai_key,
-    )
-    audio_blob, audio_provider = _synthesize_rime_audio(
-        text=reply_text,
-        voice_name=_resolve_voice_name(agent.voice_id),
-        rime_api_key=rime_key,
-    )
+        if audio_blob:
+            audio_id = await _store_audio_blob(audio_blob)
+            audio_url = _public_url_for(request, "twilio_audio_file", audio_id=audio_id)
 
     logger.info(
-        "twilio.gather agent_id=%s model=%s prompt_version=%s text_provider=%s audio_provider=%s has_speech=%s",
+        "twilio.gather agent_id=%s model=%s prompt_version=%s text_provider=%s audio_provider=%s has_speech=%s first_audio_ms=%d",
         agent.agent_id,
         agent.model,
         agent.prompt_version,
         text_provider,
         audio_provider,
-        bool(speech_result.strip()),
+        has_speech,
+        round((time.perf_counter() - started) * 1000),
     )
 
-    if existing is not None:
-        existing.sentiment = "positive" if speech_result.strip() else "neutral"
-        existing.updated_at = datetime.now(timezone.utc)
-        db.add(existing)
-        db.commit()
-
-    if audio_blob:
-        audio_bytes, media_type = audio_blob
-        audio_id = _store_audio_blob(audio_bytes, media_type)
-        audio_url = _public_url_for(request, "twilio_audio_file", audio_id=audio_id)
+    if audio_url:
         body = (
             '<?xml version="1.0" encoding="UTF-8"?>'
             "<Response>"
@@ -539,34 +875,105 @@ def voice_finish_webhook() -> Response:
     return Response(content=twiml, media_type="application/xml")
 
 
-@router.post("/recording", name="recording_status_webhook")
-def recording_status_webhook(
-    call_sid: str = Form(alias="CallSid"),
-    recording_url: str = Form(default="", alias="RecordingUrl"),
-    recording_duration: str = Form(default="0", alias="RecordingDuration"),
-    db: Session = Depends(get_db),
-) -> dict[str, str]:
-    existing = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).first()
+def _parse_callback_duration(value: str) -> Optional[int]:
+    try:
+        return int(value)
+    except ValueError:
+        return None
 
-    if existing is None:
-        return {"status": "ignored", "reason": "unknown call sid"}
 
-    if recording_url.strip():
-        existing.recording_url = recording_url.strip()
+def _apply_call_callback(db: Session, callback: dict[str, Any]) -> dict[str, str]:
+    existing = (
+        db.query(CallSessionRecord)
+        .filter(CallSessionRecord.call_sid == callback["callSid"])
+        .with_for_update()
+        .first()
+    )
 
-    try:
-        duration = int(recording_duration)
-    except ValueError:
-        duration = existing.duration_seconds
+    if existing is None:
+        return {"status": "ignored", "reason": "unknown call sid"}
 
-    existing.duration_seconds = max(duration, existing.duration_seconds)
-    existing.updated_at = datetime.now(timezone.utc)
+    update = CallUpdate(existing.call_sid)
+    update.add(callback)
+    previous_duration = existing.duration_seconds
+    update.apply(existing)
     db.add(existing)
+    record_call_duration(db, existing, previous_duration)
     db.commit()
+    response_cache.invalidate(DASHBOARD_CACHE_TAG, ORGANIZATIONS_CACHE_TAG)
+    _publish_call_event(CALL_STATUS_CHANGED_EVENT, existing)
 
     return {"status": "ok"}
 
 
+def _flush_call_updates(updates: dict[str, CallUpdate]) -> None:
+    call_sids = list(updates)
+    changed = []
+    usage_deltas: dict[UsageKey, list[int]] = {}
+
+    with SessionLocal() as db:
+        for start in range(0, len(call_sids), CALLBACK_FLUSH_BATCH_SIZE):
+            rows = (
+                db.query(CallSessionRecord)
+                .filter(CallSessionRecord.call_sid.in_(call_sids[start : start + CALLBACK_FLUSH_BATCH_SIZE]))
+                .order_by(CallSessionRecord.id)
+                .with_for_update()
+                .all()
+            )
+
+            for row in rows:
+                previous_duration = row.duration_seconds
+                updates[row.call_sid].apply(row)
+                add_call_duration(usage_deltas, row, previous_duration)
+                changed.append(row)
+
+        apply_usage_deltas(db, usage_deltas)
+        db.commit()
+
+    if len(changed) < len(updates):
+        logger.warning("Dropped buffered callbacks for %s unknown call sids", len(updates) - len(changed))
+
+    if changed:
+        response_cache.invalidate(DASHBOARD_CACHE_TAG, ORGANIZATIONS_CACHE_TAG)
+
+    for row in changed:
+        _publish_call_event(CALL_STATUS_CHANGED_EVENT, row)
+
+
+callback_buffer = CallbackBuffer(
+    runtime_settings.twilio_callback_wal_dir,
+    runtime_settings.twilio_callback_flush_interval_seconds,
+    runtime_settings.twilio_callback_flush_max_pending,
+    _flush_call_updates,
+)
+
+
+def _handle_call_callback(db: Session, callback: dict[str, Any]) -> dict[str, str]:
+    if runtime_settings.twilio_callback_write_behind_enabled:
+        callback_buffer.submit(callback)
+        return {"status": "accepted"}
+
+    return _apply_call_callback(db, callback)
+
+
+@router.post("/recording", name="recording_status_webhook")
+def recording_status_webhook(
+    call_sid: str = Form(alias="CallSid"),
+    recording_url: str = Form(default="", alias="RecordingUrl"),
+    recording_duration: str = Form(default="0", alias="RecordingDuration"),
+    db: Session = Depends(get_db),
+) -> dict[str, str]:
+    return _handle_call_callback(
+        db,
+        {
+            "callSid": call_sid,
+            "kind": RECORDING_CALLBACK,
+            "duration": _parse_callback_duration(recording_duration),
+            "recordingUrl": recording_url.strip(),
+        },
+    )
+
+
 @router.post("/status")
 def call_status_webhook(
     call_sid: str = Form(alias="CallSid"),
@@ -575,24 +982,13 @@ def call_status_webhook(
     recording_url: str = Form(default="", alias="RecordingUrl"),
     db: Session = Depends(get_db),
 ) -> dict[str, str]:
-    existing = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).first()
-
-    if existing is None:
-        return {"status": "ignored", "reason": "unknown call sid"}
-
-    try:
-        duration = int(call_duration)
-    except ValueError:
-        duration = existing.duration_seconds
-
-    existing.status = _twilio_status_to_domain(call_status)
-    existing.duration_seconds = max(duration, 0)
-
-    if recording_url.strip():
-        existing.recording_url = recording_url.strip()
-
-    existing.updated_at = datetime.now(timezone.utc)
-    db.add(existing)
-    db.commit()
-
-    return {"status": "ok"}
+    return _handle_call_callback(
+        db,
+        {
+            "callSid": call_sid,
+            "kind": STATUS_CALLBACK,
+            "status": _twilio_status_to_domain(call_status),
+            "duration": _parse_callback_duration(call_duration),
+            "recordingUrl": recording_url.strip(),
+        },
+    )
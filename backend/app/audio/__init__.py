@@ -0,0 +1,30 @@
+from backend.app.audio.blobs import AudioBlob, AudioData
+from backend.app.audio.http import AudioResponse, build_audio_response, parse_byte_range
+from backend.app.audio.store import (
+    AudioBlobStore,
+    DirectoryAudioBlobStore,
+    MemoryAudioBlobStore,
+    RedisAudioBlobStore,
+    build_audio_store,
+)
+from backend.app.audio.synthesis_cache import (
+    SynthesisCache,
+    normalize_synthesis_text,
+    synthesis_cache_key,
+)
+
+__all__ = [
+    "AudioBlob",
+    "AudioBlobStore",
+    "AudioData",
+    "AudioResponse",
+    "DirectoryAudioBlobStore",
+    "MemoryAudioBlobStore",
+    "RedisAudioBlobStore",
+    "SynthesisCache",
+    "build_audio_response",
+    "build_audio_store",
+    "normalize_synthesis_text",
+    "parse_byte_range",
+    "synthesis_cache_key",
+]
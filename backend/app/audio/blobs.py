@@ -0,0 +1,25 @@
+import hashlib
+from typing import Union
+
+AudioData = Union[bytes, memoryview]
+
+
+class AudioBlob:
+    """Immutable synthesized audio shared by every cache entry that plays it."""
+
+    __slots__ = ("key", "data", "media_type")
+
+    def __init__(self, key: str, data: AudioData, media_type: str) -> None:
+        self.key = key
+        self.data = data
+        self.media_type = media_type
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def etag(self) -> str:
+        # Keys are synthesis hashes or one-off reply ids and a key never changes its bytes,
+        # so hashing the key is as strong as hashing the audio without reading it per request.
+        return f'"{hashlib.blake2b(self.key.encode(), digest_size=16).hexdigest()}"'
@@ -0,0 +1,88 @@
+import re
+from typing import Any, Mapping, Optional
+
+from fastapi import Response, status
+
+from backend.app.audio.blobs import AudioBlob
+
+BYTE_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class AudioResponse(Response):
+    """Response that hands memoryview slices to the server without copying them."""
+
+    def render(self, content: Any) -> Any:
+        if isinstance(content, memoryview):
+            return content
+
+        return super().render(content)
+
+
+def parse_byte_range(range_header: str, size: int) -> Optional[tuple[int, int]]:
+    """Return the inclusive (start, end) of a single-range header, or None to serve the full body."""
+    match = BYTE_RANGE_PATTERN.match(range_header.strip())
+
+    if match is None:
+        return None
+
+    raw_start, raw_end = match.groups()
+
+    if not raw_start and not raw_end:
+        return None
+
+    if not raw_start:
+        suffix_length = int(raw_end)
+
+        if suffix_length == 0 or size == 0:
+            raise ValueError("Unsatisfiable range")
+
+        return max(size - suffix_length, 0), size - 1
+
+    start = int(raw_start)
+    end = min(int(raw_end), size - 1) if raw_end else size - 1
+
+    if start >= size or start > end:
+        raise ValueError("Unsatisfiable range")
+
+    return start, end
+
+
+def _etag_matches(header_value: str, etag: str) -> bool:
+    candidates = {candidate.strip() for candidate in header_value.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def build_audio_response(blob: AudioBlob, request_headers: Mapping[str, str], max_age: int) -> Response:
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": f"public, max-age={max_age}, immutable",
+        "ETag": blob.etag,
+    }
+    if_none_match = request_headers.get("if-none-match")
+
+    if if_none_match and _etag_matches(if_none_match, blob.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = memoryview(blob.data)
+    range_header = request_headers.get("range")
+    if_range = request_headers.get("if-range")
+
+    if range_header and (not if_range or if_range.strip() == blob.etag):
+        try:
+            byte_range = parse_byte_range(range_header, blob.size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{blob.size}"},
+            )
+
+        if byte_range is not None:
+            start, end = byte_range
+            return AudioResponse(
+                content=body[start : end + 1],
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=blob.media_type,
+                headers={**headers, "Content-Range": f"bytes {start}-{end}/{blob.size}"},
+            )
+
+    return AudioResponse(content=body, media_type=blob.media_type, headers=headers)
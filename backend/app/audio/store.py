@@ -0,0 +1,374 @@
+import heapq
+import mmap
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from backend.app.audio.blobs import AudioBlob, AudioData
+from backend.app.core.settings import Settings
+
+AUDIO_STORE_BACKENDS = ("memory", "directory", "redis")
+
+
+class AudioBlobStore(ABC):
+    """Short-lived audio served to Twilio by id, bounded by bytes and TTL."""
+
+    blocking = False
+    shared = False
+
+    def __init__(self, max_bytes: int, ttl_seconds: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self._counter_lock = threading.Lock()
+
+    @abstractmethod
+    def put(self, audio_id: str, blob: AudioBlob) -> None:
+        """Store ``blob`` under ``audio_id`` for ``ttl_seconds``, evicting to stay within ``max_bytes``."""
+
+    @abstractmethod
+    def get(self, audio_id: str) -> Optional[AudioBlob]:
+        """Return the blob stored under ``audio_id``, or None once it expired or was evicted."""
+
+    def mark_pending(self, audio_id: str) -> None:
+        return None
+
+    def is_pending(self, audio_id: str) -> bool:
+        return False
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every stored blob."""
+
+    def stats(self) -> dict[str, int]:
+        with self._counter_lock:
+            return dict(self._counters)
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._counter_lock:
+            self._counters[counter] += amount
+
+
+class MemoryAudioBlobStore(AudioBlobStore):
+    """In-process LRU with heap-ordered TTL expiry; shared blobs are budgeted once."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float) -> None:
+        super().__init__(max_bytes, ttl_seconds)
+        self._entries: OrderedDict[str, tuple[AudioBlob, float]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._blob_refs: dict[str, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, audio_id: str, blob: AudioBlob) -> None:
+        now = time.monotonic()
+        expires_at = now + self.ttl_seconds
+
+        with self._lock:
+            self._expire(now)
+            self._remove(audio_id)
+            self._entries[audio_id] = (blob, expires_at)
+            heapq.heappush(self._expiry_heap, (expires_at, audio_id))
+            self._retain(blob)
+
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                evicted_id = next(iter(self._entries))
+                self._remove(evicted_id)
+                self._count("evictions")
+
+    def get(self, audio_id: str) -> Optional[AudioBlob]:
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.get(audio_id)
+
+            if entry is None:
+                self._count("misses")
+                return None
+
+            self._entries.move_to_end(audio_id)
+            self._count("hits")
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._blob_refs.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        counters = super().stats()
+
+        with self._lock:
+            counters["entries"] = len(self._entries)
+            counters["bytes"] = self._total_bytes
+
+        return counters
+
+    def _expire(self, now: float) -> None:
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, audio_id = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(audio_id)
+
+            if entry is not None and entry[1] == expires_at:
+                self._remove(audio_id)
+                self._count("expirations")
+
+    def _remove(self, audio_id: str) -> None:
+        entry = self._entries.pop(audio_id, None)
+
+        if entry is not None:
+            self._release(entry[0])
+
+    def _retain(self, blob: AudioBlob) -> None:
+        refs = self._blob_refs.get(blob.key, 0)
+
+        if refs == 0:
+            self._total_bytes += blob.size
+
+        self._blob_refs[blob.key] = refs + 1
+
+    def _release(self, blob: AudioBlob) -> None:
+        refs = self._blob_refs.get(blob.key, 0) - 1
+
+        if refs > 0:
+            self._blob_refs[blob.key] = refs
+            return
+
+        self._blob_refs.pop(blob.key, None)
+        self._total_bytes -= blob.size
+
+
+class DirectoryAudioBlobStore(AudioBlobStore):
+    """Host-wide store: blobs under ``blobs/``, one pointer file per audio id under ``ids/``."""
+
+    blocking = True
+    shared = True
+    PENDING_MARKER = "pending"
+
+    def __init__(self, max_bytes: int, ttl_seconds: float, directory: str) -> None:
+        super().__init__(max_bytes, ttl_seconds)
+        self.directory = Path(directory)
+        self.blobs_dir = self.directory / "blobs"
+        self.ids_dir = self.directory / "ids"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.ids_dir.mkdir(parents=True, exist_ok=True)
+        self.sweep_interval_seconds = max(1.0, min(60.0, ttl_seconds / 4))
+        self._next_sweep_at = 0.0
+        self._sweep_lock = threading.Lock()
+
+    def put(self, audio_id: str, blob: AudioBlob) -> None:
+        blob_path = self.blobs_dir / blob.key
+
+        if blob_path.exists():
+            os.utime(blob_path)
+        else:
+            self._write_atomic(blob_path, blob.data)
+
+        self._write_atomic(self.ids_dir / audio_id, f"{blob.media_type}\n{blob.key}".encode("utf-8"))
+        self._maybe_sweep()
+
+    def get(self, audio_id: str) -> Optional[AudioBlob]:
+        id_path = self.ids_dir / audio_id
+
+        try:
+            pointer = id_path.read_text(encoding="utf-8")
+            age = time.time() - id_path.stat().st_mtime
+        except OSError:
+            self._count("misses")
+            return None
+
+        media_type, _, blob_key = pointer.partition("\n")
+
+        if media_type == self.PENDING_MARKER or not blob_key:
+            self._count("misses")
+            return None
+
+        if age > self.ttl_seconds:
+            self._unlink(id_path)
+            self._count("expirations")
+            self._count("misses")
+            return None
+
+        try:
+            data = self._map_blob(self.blobs_dir / blob_key)
+        except OSError:
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        return AudioBlob(key=blob_key, data=data, media_type=media_type)
+
+    def mark_pending(self, audio_id: str) -> None:
+        self._write_atomic(self.ids_dir / audio_id, f"{self.PENDING_MARKER}\n".encode("utf-8"))
+
+    def is_pending(self, audio_id: str) -> bool:
+        try:
+            pointer = (self.ids_dir / audio_id).read_text(encoding="utf-8")
+        except OSError:
+            return False
+
+        return pointer.startswith(f"{self.PENDING_MARKER}\n")
+
+    def clear(self) -> None:
+        for folder in (self.ids_dir, self.blobs_dir):
+            for path in folder.iterdir():
+                self._unlink(path)
+
+    def sweep(self) -> None:
+        cutoff = time.time() - self.ttl_seconds
+
+        for id_path in self.ids_dir.iterdir():
+            try:
+                if id_path.stat().st_mtime < cutoff:
+                    self._unlink(id_path)
+                    self._count("expirations")
+            except OSError:
+                continue
+
+        blob_files: list[tuple[float, int, Path]] = []
+
+        for blob_path in self.blobs_dir.iterdir():
+            try:
+                blob_stat = blob_path.stat()
+            except OSError:
+                continue
+
+            if blob_stat.st_mtime < cutoff:
+                self._unlink(blob_path)
+                continue
+
+            blob_files.append((blob_stat.st_mtime, blob_stat.st_size, blob_path))
+
+        total_bytes = sum(size for _, size, _ in blob_files)
+
+        for _, size, blob_path in sorted(blob_files):
+            if total_bytes <= self.max_bytes:
+                break
+
+            self._unlink(blob_path)
+            total_bytes -= size
+            self._count("evictions")
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+
+        if now < self._next_sweep_at or not self._sweep_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._next_sweep_at = now + self.sweep_interval_seconds
+            self.sweep()
+        finally:
+            self._sweep_lock.release()
+
+    @staticmethod
+    def _map_blob(blob_path: Path) -> AudioData:
+        with open(blob_path, "rb") as blob_file:
+            if os.fstat(blob_file.fileno()).st_size == 0:
+                return b""
+
+            mapped = mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        os.utime(blob_path)
+        return memoryview(mapped)
+
+    @staticmethod
+    def _write_atomic(path: Path, payload: bytes) -> None:
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            return
+
+
+class RedisAudioBlobStore(AudioBlobStore):
+    """Store backed by any Redis-compatible server; the server enforces TTL and memory limits."""
+
+    blocking = True
+    shared = True
+    PENDING_MARKER = b"pending"
+
+    def __init__(self, max_bytes: int, ttl_seconds: float, url: str, prefix: str = "audio") -> None:
+        super().__init__(max_bytes, ttl_seconds)
+
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("AUDIO_STORE_BACKEND=redis requires the 'redis' package") from exc
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def put(self, audio_id: str, blob: AudioBlob) -> None:
+        if blob.size > self.max_bytes:
+            self._count("evictions")
+            return
+
+        ttl = max(1, int(self.ttl_seconds))
+        pipeline = self.client.pipeline()
+        pipeline.set(self._blob_key(blob.key), blob.data, ex=ttl)
+        pipeline.set(self._id_key(audio_id), f"{blob.media_type}\n{blob.key}".encode("utf-8"), ex=ttl)
+        pipeline.execute()
+
+    def get(self, audio_id: str) -> Optional[AudioBlob]:
+        pointer = self.client.get(self._id_key(audio_id))
+
+        if not pointer or pointer == self.PENDING_MARKER:
+            self._count("misses")
+            return None
+
+        media_type, _, blob_key = pointer.decode("utf-8").partition("\n")
+        data = self.client.get(self._blob_key(blob_key))
+
+        if data is None:
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        return AudioBlob(key=blob_key, data=data, media_type=media_type)
+
+    def mark_pending(self, audio_id: str) -> None:
+        self.client.set(self._id_key(audio_id), self.PENDING_MARKER, ex=max(1, int(self.ttl_seconds)))
+
+    def is_pending(self, audio_id: str) -> bool:
+        return self.client.get(self._id_key(audio_id)) == self.PENDING_MARKER
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=f"{self.prefix}:*"):
+            self.client.delete(key)
+
+    def _id_key(self, audio_id: str) -> str:
+        return f"{self.prefix}:id:{audio_id}"
+
+    def _blob_key(self, blob_key: str) -> str:
+        return f"{self.prefix}:blob:{blob_key}"
+
+
+def build_audio_store(settings: Settings) -> AudioBlobStore:
+    backend = settings.audio_store_backend.strip().lower()
+
+    if backend not in AUDIO_STORE_BACKENDS:
+        raise ValueError(f"Unsupported AUDIO_STORE_BACKEND: {settings.audio_store_backend}")
+
+    max_bytes = settings.audio_store_max_bytes
+    ttl_seconds = settings.audio_store_ttl_seconds
+
+    if backend == "directory":
+        directory = settings.audio_store_dir or os.path.join(tempfile.gettempdir(), "orchestrator-audio")
+        return DirectoryAudioBlobStore(max_bytes, ttl_seconds, directory)
+
+    if backend == "redis":
+        return RedisAudioBlobStore(max_bytes, ttl_seconds, settings.audio_store_redis_url)
+
+    return MemoryAudioBlobStore(max_bytes, ttl_seconds)
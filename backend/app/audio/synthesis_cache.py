@@ -0,0 +1,104 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from backend.app.audio.blobs import AudioBlob
+
+
+def normalize_synthesis_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def synthesis_cache_key(voice_name: str, model_id: str, text: str) -> str:
+    material = "\0".join([voice_name.strip().lower(), model_id, normalize_synthesis_text(text)])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class SynthesisCache:
+    """Byte-bounded LRU of synthesized audio with an optional on-disk tier."""
+
+    def __init__(self, max_bytes: int, disk_dir: str = "") -> None:
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[str, AudioBlob] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def disk_enabled(self) -> bool:
+        return self.disk_dir is not None
+
+    def get(self, key: str) -> Optional[AudioBlob]:
+        with self._lock:
+            blob = self._entries.get(key)
+
+            if blob is not None:
+                self._entries.move_to_end(key)
+
+            return blob
+
+    def load_from_disk(self, key: str) -> Optional[AudioBlob]:
+        if self.disk_dir is None:
+            return None
+
+        try:
+            raw = self._disk_path(key).read_bytes()
+        except OSError:
+            return None
+
+        media_type, _, data = raw.partition(b"\n")
+
+        if not data:
+            return None
+
+        blob = AudioBlob(key=key, data=data, media_type=media_type.decode("ascii"))
+        self._remember(blob)
+        return blob
+
+    def put(self, key: str, data: bytes, media_type: str) -> AudioBlob:
+        blob = AudioBlob(key=key, data=data, media_type=media_type)
+        self._remember(blob)
+
+        if self.disk_dir is not None:
+            self._write_to_disk(blob)
+
+        return blob
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remember(self, blob: AudioBlob) -> None:
+        if blob.size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(blob.key, None)
+
+            if previous is not None:
+                self._total_bytes -= previous.size
+
+            self._entries[blob.key] = blob
+            self._total_bytes += blob.size
+
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted.size
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / key
+
+    def _write_to_disk(self, blob: AudioBlob) -> None:
+        path = self._disk_path(blob.key)
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            temp_path.write_bytes(blob.media_type.encode("ascii") + b"\n" + blob.data)
+            os.replace(temp_path, path)
+        except OSError:
+            return
@@ -0,0 +1,66 @@
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from backend.app.db import SettingsAuditFieldRecord, SettingsAuditRecord, normalize_actor
+from backend.app.ids import allocate_ids
+
+SETTINGS_AUDIT_SEQUENCE = "settings-audit"
+
+
+class SettingsAuditDraft:
+    """A settings change waiting for its audit event id; platform-wide changes have no organization."""
+
+    __slots__ = ("actor", "reason", "changed_fields", "changed_at", "organization_id")
+
+    def __init__(
+        self,
+        actor: str,
+        reason: Optional[str],
+        changed_fields: list[str],
+        changed_at: Optional[datetime] = None,
+        organization_id: Optional[int] = None,
+    ) -> None:
+        self.actor = actor
+        self.reason = reason
+        self.changed_fields = changed_fields
+        self.changed_at = changed_at
+        self.organization_id = organization_id
+
+
+def record_settings_audit(db: Session, drafts: Sequence[SettingsAuditDraft]) -> list[str]:
+    """Write audit entries and their field index rows in the caller's transaction."""
+    if not drafts:
+        return []
+
+    now = datetime.now(timezone.utc)
+    values = allocate_ids(db, SETTINGS_AUDIT_SEQUENCE, len(drafts))
+    event_ids = [f"{SETTINGS_AUDIT_SEQUENCE}-{value}" for value in values]
+    audit_rows: list[dict[str, object]] = []
+    field_rows: list[dict[str, object]] = []
+
+    for event_id, draft in zip(event_ids, drafts):
+        audit_rows.append(
+            {
+                "event_id": event_id,
+                "changed_at": draft.changed_at or now,
+                "actor": draft.actor,
+                "actor_normalized": normalize_actor(draft.actor),
+                "reason": draft.reason,
+                "changed_fields": draft.changed_fields,
+                "organization_id": draft.organization_id,
+            }
+        )
+        field_rows.extend(
+            {"event_id": event_id, "field_name": field, "field_normalized": field.strip().lower()}
+            for field in dict.fromkeys(draft.changed_fields)
+        )
+
+    db.execute(insert(SettingsAuditRecord), audit_rows)
+
+    if field_rows:
+        db.execute(insert(SettingsAuditFieldRecord), field_rows)
+
+    return event_ids
@@ -0,0 +1,349 @@
+import heapq
+import os
+import re
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from backend.app.core.settings import get_settings
+from backend.app.db import CallSessionRecord, SessionLocal, initialize_database
+
+ARCHIVE_FILE_PATTERN = re.compile(r"^calls-(\d{4})-(\d{2})\.parquet$")
+ARCHIVE_BATCH_SIZE = 1000
+ARCHIVE_DELETE_BATCH_SIZE = 500
+ARCHIVE_COLUMNS = tuple(CallSessionRecord.__table__.columns.keys())
+ARCHIVE_TIMESTAMP_COLUMNS = ("started_at", "updated_at")
+ARCHIVE_INTEGER_COLUMNS = ("id", "organization_id", "duration_seconds")
+settings = get_settings()
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise RuntimeError("Call archival requires the 'pyarrow' package") from exc
+
+    return pyarrow
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+
+    return value.astimezone(timezone.utc)
+
+
+def _month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _next_month(month: date) -> date:
+    return _month_start(month + timedelta(days=32))
+
+
+def _month_bounds(month: date) -> tuple[datetime, datetime]:
+    following = _next_month(month)
+    return (
+        datetime(month.year, month.month, 1, tzinfo=timezone.utc),
+        datetime(following.year, following.month, 1, tzinfo=timezone.utc),
+    )
+
+
+def _archive_record(row) -> dict[str, object]:
+    record = dict(zip(ARCHIVE_COLUMNS, row))
+
+    for column in ARCHIVE_TIMESTAMP_COLUMNS:
+        record[column] = _as_utc(record[column])
+
+    return record
+
+
+def _archive_sort_key(record: dict[str, object]) -> tuple:
+    return record["started_at"], record["id"]
+
+
+def _chunks(records: Iterable[dict[str, object]], size: int) -> Iterator[list[dict[str, object]]]:
+    records = iter(records)
+
+    while True:
+        chunk = list(islice(records, size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _outside_range(statistics, from_ts: Optional[datetime], upper_ts: Optional[datetime]) -> bool:
+    if statistics is None or not statistics.has_min_max or not isinstance(statistics.min, datetime):
+        return False
+
+    if upper_ts is not None and _as_utc(statistics.min) > _as_utc(upper_ts):
+        return True
+
+    return from_ts is not None and _as_utc(statistics.max) < _as_utc(from_ts)
+
+
+def _archive_schema(pa):
+    return pa.schema(
+        [
+            (
+                column,
+                pa.timestamp("us", tz="UTC")
+                if column in ARCHIVE_TIMESTAMP_COLUMNS
+                else pa.int64()
+                if column in ARCHIVE_INTEGER_COLUMNS
+                else pa.string(),
+            )
+            for column in ARCHIVE_COLUMNS
+        ]
+    )
+
+
+class CallArchive:
+    """Monthly ``calls-YYYY-MM.parquet`` files of call sessions moved out of ``call_sessions``."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def months(self) -> list[date]:
+        if not self.directory.is_dir():
+            return []
+
+        months = []
+
+        for path in self.directory.iterdir():
+            match = ARCHIVE_FILE_PATTERN.match(path.name)
+
+            if match:
+                months.append(date(int(match.group(1)), int(match.group(2)), 1))
+
+        return sorted(months)
+
+    def archived_through(self) -> Optional[date]:
+        """First day after the newest archived month, or None when nothing is archived."""
+        months = self.months()
+        return _next_month(months[-1]) if months else None
+
+    def archive(self, db: Session, before: date) -> int:
+        """Move calls that started before the month containing ``before`` into the archive."""
+        cutoff, _ = _month_bounds(_month_start(before))
+        archived = 0
+
+        while True:
+            oldest = db.scalar(
+                select(func.min(CallSessionRecord.started_at)).where(CallSessionRecord.started_at < cutoff)
+            )
+
+            if oldest is None:
+                return archived
+
+            archived += self._archive_month(db, _month_start(_as_utc(oldest).date()))
+
+    def read(
+        self,
+        *,
+        call_status: Optional[str] = None,
+        agent_name_normalized: Optional[str] = None,
+        organization_id: Optional[int] = None,
+        from_ts: Optional[datetime] = None,
+        to_ts: Optional[datetime] = None,
+        before: Optional[tuple[datetime, int]] = None,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+    ) -> Iterator[list[CallSessionRecord]]:
+        """Yield matching archived calls as detached records; ``before`` is a ``(started_at, id)`` cursor."""
+        months = self.months()
+
+        if not months:
+            return
+
+        pa = _pyarrow()
+        lower = _month_start(_as_utc(from_ts).date()) if from_ts is not None else None
+        upper_ts = before[0] if before is not None else to_ts
+        upper = _month_start(_as_utc(upper_ts).date()) if upper_ts is not None else None
+        expression = self._filter_expression(
+            pa, call_status, agent_name_normalized, organization_id, from_ts, to_ts, before
+        )
+        remaining = limit
+
+        for month in reversed(months) if newest_first else months:
+            if (lower is not None and month < lower) or (upper is not None and month > upper):
+                continue
+
+            for table in self._read_row_groups(pa, month, expression, from_ts, upper_ts, newest_first):
+                if remaining is not None:
+                    table = table.slice(0, remaining)
+                    remaining -= table.num_rows
+
+                if table.num_rows:
+                    yield [CallSessionRecord(**row) for row in table.to_pylist()]
+
+                if remaining == 0:
+                    return
+
+    def _read_row_groups(
+        self,
+        pa,
+        month: date,
+        expression,
+        from_ts: Optional[datetime],
+        upper_ts: Optional[datetime],
+        newest_first: bool,
+    ) -> Iterator:
+        # Files are sorted by (started_at, id), so row groups can be pruned and read in order.
+        order = "descending" if newest_first else "ascending"
+
+        with pa.parquet.ParquetFile(self._path(month)) as archive_file:
+            started_at_index = archive_file.schema_arrow.get_field_index("started_at")
+            row_groups = range(archive_file.num_row_groups)
+
+            for index in reversed(row_groups) if newest_first else row_groups:
+                statistics = archive_file.metadata.row_group(index).column(started_at_index).statistics
+
+                if _outside_range(statistics, from_ts, upper_ts):
+                    continue
+
+                table = archive_file.read_row_group(index)
+
+                if expression is not None:
+                    table = table.filter(expression)
+
+                yield table.sort_by([("started_at", order), ("id", order)])
+
+    def _path(self, month: date) -> Path:
+        return self.directory / f"calls-{month:%Y-%m}.parquet"
+
+    def _archive_month(self, db: Session, month: date) -> int:
+        """Write one month to its Parquet file, then delete its rows from the table."""
+        pa = _pyarrow()
+        month_from, month_to = _month_bounds(month)
+        in_month = (CallSessionRecord.started_at >= month_from, CallSessionRecord.started_at < month_to)
+        key_result = db.execute(
+            select(CallSessionRecord.id, CallSessionRecord.call_id)
+            .where(*in_month)
+            .execution_options(yield_per=ARCHIVE_BATCH_SIZE)
+        )
+        keys = pa.Table.from_batches(
+            [
+                pa.record_batch([pa.array(column) for column in zip(*partition)], names=["id", "call_id"])
+                for partition in key_result.partitions()
+            ]
+        )
+
+        if keys.num_rows == 0:
+            return 0
+
+        ids = keys.column("id").combine_chunks()
+        call_ids = keys.column("call_id").combine_chunks()
+
+        schema = _archive_schema(pa)
+        path = self._path(month)
+        staging_path = path.with_name(f"{path.name}.tmp")
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with pa.parquet.ParquetWriter(staging_path, schema, compression="zstd") as writer:
+            rows = db.execute(
+                select(*(CallSessionRecord.__table__.c[column] for column in ARCHIVE_COLUMNS))
+                .where(*in_month, CallSessionRecord.id <= pa.compute.max(ids).as_py())
+                .order_by(CallSessionRecord.started_at.asc(), CallSessionRecord.id.asc())
+                .execution_options(yield_per=ARCHIVE_BATCH_SIZE)
+            )
+            records = heapq.merge(
+                self._kept_records(pa, path, call_ids),
+                (_archive_record(row) for partition in rows.partitions() for row in partition),
+                key=_archive_sort_key,
+            )
+
+            for chunk in _chunks(records, ARCHIVE_BATCH_SIZE):
+                writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+
+        os.replace(staging_path, path)
+
+        for start in range(0, len(ids), ARCHIVE_DELETE_BATCH_SIZE):
+            db.execute(
+                delete(CallSessionRecord)
+                .where(CallSessionRecord.id.in_(ids[start : start + ARCHIVE_DELETE_BATCH_SIZE].to_pylist()))
+                .execution_options(synchronize_session=False)
+            )
+
+        db.commit()
+        return len(ids)
+
+    @staticmethod
+    def _kept_records(pa, path: Path, call_ids) -> Iterator[dict[str, object]]:
+        if not path.exists():
+            return
+
+        with pa.parquet.ParquetFile(path) as archive_file:
+            for batch in archive_file.iter_batches(batch_size=ARCHIVE_BATCH_SIZE):
+                # Matched by call_id, not id: SQLite may reuse a deleted row's primary key.
+                kept = batch.filter(pa.compute.invert(pa.compute.is_in(batch.column("call_id"), value_set=call_ids)))
+                yield from kept.to_pylist()
+
+    @staticmethod
+    def _filter_expression(
+        pa,
+        call_status: Optional[str],
+        agent_name_normalized: Optional[str],
+        organization_id: Optional[int],
+        from_ts: Optional[datetime],
+        to_ts: Optional[datetime],
+        before: Optional[tuple[datetime, int]],
+    ):
+        field = pa.compute.field
+        conditions = []
+
+        if call_status is not None:
+            conditions.append(field("status") == call_status)
+
+        if agent_name_normalized is not None:
+            conditions.append(field("agent_name_normalized") == agent_name_normalized)
+
+        if organization_id is not None:
+            conditions.append(field("organization_id") == organization_id)
+
+        if from_ts is not None:
+            conditions.append(field("started_at") >= pa.scalar(_as_utc(from_ts), pa.timestamp("us", tz="UTC")))
+
+        if to_ts is not None:
+            conditions.append(field("started_at") <= pa.scalar(_as_utc(to_ts), pa.timestamp("us", tz="UTC")))
+
+        if before is not None:
+            started_at = pa.scalar(_as_utc(before[0]), pa.timestamp("us", tz="UTC"))
+            conditions.append(
+                (field("started_at") < started_at) | ((field("started_at") == started_at) & (field("id") < before[1]))
+            )
+
+        if not conditions:
+            return None
+
+        expression = conditions[0]
+
+        for condition in conditions[1:]:
+            expression = expression & condition
+
+        return expression
+
+
+call_archive = CallArchive(settings.call_archive_dir)
+
+
+def main() -> None:
+    initialize_database()
+    before = datetime.now(timezone.utc).date() - timedelta(days=settings.call_retention_days)
+
+    with SessionLocal() as db:
+        archived = call_archive.archive(db, before)
+
+    print(f"Archived {archived} calls to {call_archive.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from backend.app.db import CallSessionRecord, dialect_upsert_insert
+from backend.app.ids import allocate_external_id
+
+PENDING_CALL_ID_PREFIX = "pending-"
+
+
+def upsert_call_session(
+    db: Session,
+    values: dict[str, Any],
+    changes: dict[str, Any],
+) -> tuple[CallSessionRecord, bool]:
+    """Create or update the session for ``values["call_sid"]``; returns it and whether it was created."""
+    insert = dialect_upsert_insert(db)
+
+    if insert is None:
+        return _select_or_insert_call_session(db, values, changes)
+
+    call_id = values.get("call_id") or f"{PENDING_CALL_ID_PREFIX}{uuid4().hex}"
+    statement = insert(CallSessionRecord).values(**{**values, "call_id": call_id})
+    statement = statement.on_conflict_do_update(
+        index_elements=[CallSessionRecord.call_sid],
+        # DO NOTHING would return no row for an existing call, so rewrite call_sid when there is nothing to change.
+        set_=changes or {"call_sid": statement.excluded.call_sid},
+    ).returning(CallSessionRecord)
+    call_session = db.scalars(statement, execution_options={"populate_existing": True}).one()
+    created = call_session.call_id == call_id
+
+    if created and call_id.startswith(PENDING_CALL_ID_PREFIX):
+        call_session.call_id = allocate_external_id(db, "call")
+        db.flush()
+
+    return call_session, created
+
+
+def _select_or_insert_call_session(
+    db: Session,
+    values: dict[str, Any],
+    changes: dict[str, Any],
+) -> tuple[CallSessionRecord, bool]:
+    call_session = (
+        db.query(CallSessionRecord)
+        .filter(CallSessionRecord.call_sid == values["call_sid"])
+        .with_for_update()
+        .first()
+    )
+
+    if call_session is None:
+        call_session = CallSessionRecord(**{"call_id": allocate_external_id(db, "call"), **values})
+        db.add(call_session)
+        db.flush()
+        return call_session, True
+
+    for column, value in changes.items():
+        setattr(call_session, column, value)
+
+    db.flush()
+    return call_session, False
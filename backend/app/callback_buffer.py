@@ -0,0 +1,271 @@
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional, TextIO
+
+STATUS_CALLBACK = "status"
+RECORDING_CALLBACK = "recording"
+WAL_SEGMENT_PATTERN = re.compile(r"^callbacks-(\d+)-(\d+)\.wal$")
+FLUSH_RETRY_MAX_SECONDS = 30.0
+logger = logging.getLogger("uvicorn.error")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+class CallUpdate:
+    """Net effect of the Twilio status/recording callbacks received for one call."""
+
+    __slots__ = ("call_sid", "status", "duration", "min_duration", "recording_url")
+
+    def __init__(self, call_sid: str) -> None:
+        self.call_sid = call_sid
+        self.status: Optional[str] = None
+        self.duration: Optional[int] = None
+        self.min_duration: Optional[int] = None
+        self.recording_url = ""
+
+    def add(self, callback: dict[str, Any]) -> None:
+        duration = callback.get("duration")
+
+        if callback["kind"] == STATUS_CALLBACK:
+            self.status = callback["status"]
+
+            if duration is not None:
+                self.duration = duration
+                self.min_duration = None
+        elif duration is not None:
+            self.min_duration = max(self.min_duration or 0, duration)
+
+        if callback.get("recordingUrl"):
+            self.recording_url = callback["recordingUrl"]
+
+    def merge(self, later: "CallUpdate") -> None:
+        if later.status is not None:
+            self.status = later.status
+
+        if later.duration is not None:
+            self.duration = later.duration
+            self.min_duration = later.min_duration
+        elif later.min_duration is not None:
+            self.min_duration = max(self.min_duration or 0, later.min_duration)
+
+        if later.recording_url:
+            self.recording_url = later.recording_url
+
+    def apply(self, call_session) -> None:
+        if self.status is not None:
+            call_session.status = self.status
+
+        if self.duration is not None:
+            call_session.duration_seconds = max(self.duration, 0)
+
+        if self.min_duration is not None:
+            call_session.duration_seconds = max(call_session.duration_seconds, self.min_duration)
+
+        if self.recording_url:
+            call_session.recording_url = self.recording_url
+
+        call_session.updated_at = datetime.now(timezone.utc)
+
+
+class CallbackBuffer:
+    """Write-behind queue that coalesces call callbacks per call SID and applies them in batches."""
+
+    def __init__(
+        self,
+        wal_dir: str | Path,
+        flush_interval_seconds: float,
+        max_pending: int,
+        apply: Callable[[dict[str, CallUpdate]], None],
+    ) -> None:
+        self.wal_dir = Path(wal_dir)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self._apply = apply
+        self._pending: dict[str, CallUpdate] = {}
+        self._unflushed_segments: list[Path] = []
+        self._segment: Optional[TextIO] = None
+        self._segment_path: Optional[Path] = None
+        self._segment_number = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+
+            self.wal_dir.mkdir(parents=True, exist_ok=True)
+            self._stopping.clear()
+            self._recover_segments()
+            self._open_segment()
+            self._worker = threading.Thread(target=self._run, name="callback-buffer", daemon=True)
+            self._worker.start()
+
+    def submit(self, callback: dict[str, Any]) -> None:
+        self.start()
+
+        with self._lock:
+            self._segment.write(json.dumps(callback, separators=(",", ":")) + "\n")
+            self._segment.flush()
+            call_sid = callback["callSid"]
+            self._pending.setdefault(call_sid, CallUpdate(call_sid)).add(callback)
+            pending_count = len(self._pending)
+
+        if pending_count >= self.max_pending:
+            self._wake.set()
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                updates = self._pending
+                segments = self._unflushed_segments
+
+                if not updates:
+                    return 0
+
+                self._pending = {}
+                self._unflushed_segments = []
+
+                if self._segment is not None:
+                    self._segment.close()
+                    segments.append(self._segment_path)
+                    self._open_segment()
+
+            try:
+                self._apply(updates)
+            except Exception:
+                with self._lock:
+                    for call_sid, later in self._pending.items():
+                        if call_sid in updates:
+                            updates[call_sid].merge(later)
+                        else:
+                            updates[call_sid] = later
+
+                    self._pending = updates
+                    self._unflushed_segments = segments + self._unflushed_segments
+
+                raise
+
+            for segment in segments:
+                segment.unlink(missing_ok=True)
+
+            return len(updates)
+
+    def close(self) -> None:
+        if self._worker is None:
+            return
+
+        self._stopping.set()
+        self._wake.set()
+        self._worker.join()
+        self._worker = None
+
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to flush buffered Twilio callbacks on shutdown; they remain in the WAL")
+
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+                if not self._pending:
+                    self._segment_path.unlink(missing_ok=True)
+
+    def _run(self) -> None:
+        failures = 0
+
+        while not self._stopping.is_set():
+            if failures:
+                # Back off exponentially while the database is failing; a full queue does not cut the wait short.
+                self._stopping.wait(self._retry_delay(failures))
+            else:
+                self._wake.wait(self.flush_interval_seconds)
+
+            self._wake.clear()
+
+            try:
+                self.flush()
+            except Exception:
+                failures += 1
+                logger.exception(
+                    "Failed to flush buffered Twilio callbacks; retrying in %.2fs",
+                    self._retry_delay(failures),
+                )
+            else:
+                failures = 0
+
+    def _retry_delay(self, failures: int) -> float:
+        return min(self.flush_interval_seconds * 2 ** min(failures, 16), FLUSH_RETRY_MAX_SECONDS)
+
+    def _open_segment(self) -> None:
+        self._segment_number += 1
+        self._segment_path = self.wal_dir / f"callbacks-{os.getpid()}-{self._segment_number:08d}.wal"
+        self._segment = self._segment_path.open("a", encoding="utf-8")
+
+    def _recover_segments(self) -> None:
+        own_pid = os.getpid()
+        orphaned = []
+
+        for path in self.wal_dir.iterdir():
+            match = WAL_SEGMENT_PATTERN.match(path.name)
+
+            if match is None or path in self._unflushed_segments or path == self._segment_path:
+                continue
+
+            pid, number = int(match.group(1)), int(match.group(2))
+
+            if pid == own_pid:
+                # Left by an earlier process with a reused pid; never hand out its names again.
+                self._segment_number = max(self._segment_number, number)
+
+            if pid == own_pid or not _pid_alive(pid):
+                orphaned.append((pid, number, path))
+
+        for _, _, path in sorted(orphaned):
+            self._segment_number += 1
+            claimed = self.wal_dir / f"callbacks-{own_pid}-{self._segment_number:08d}.wal"
+
+            try:
+                # Renaming claims the segment, so two workers starting together never both replay it.
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue
+
+            self._replay_segment(claimed)
+            self._unflushed_segments.append(claimed)
+
+    def _replay_segment(self, path: Path) -> None:
+        with path.open("r", encoding="utf-8") as segment:
+            for line in segment:
+                try:
+                    callback = json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-write; the callback was never acknowledged.
+                    logger.warning("Skipping unreadable callback WAL entry in %s", path.name)
+                    continue
+
+                call_sid = callback["callSid"]
+                self._pending.setdefault(call_sid, CallUpdate(call_sid)).add(callback)
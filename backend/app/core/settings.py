@@ -8,6 +8,14 @@ class Settings(BaseSettings):
     environment: str = "development"
     debug: bool = True
     database_url: str = "sqlite:///backend/data/app.db"
+    database_read_url: str = ""
+    database_pool_size: int = 10
+    database_max_overflow: int = 20
+    database_pool_timeout_seconds: float = 30.0
+    database_pool_recycle_seconds: int = 1800
+    database_pool_pre_ping: bool = True
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size_bytes: int = 256 * 1024 * 1024
     cors_allow_origins: str = "http://localhost:5173,http://127.0.0.1:5173"
 
     auth_enabled: bool = True
@@ -26,6 +34,38 @@ class Settings(BaseSettings):
     twilio_account_sid: str = ""
     rime_api_key: str = ""
 
+    twilio_streaming_replies_enabled: bool = True
+    twilio_callback_write_behind_enabled: bool = False
+    twilio_callback_flush_interval_seconds: float = 0.05
+    twilio_callback_flush_max_pending: int = 500
+    twilio_callback_wal_dir: str = "backend/data/callback-wal"
+    agent_routing_ttl_seconds: float = 30.0
+    platform_settings_check_seconds: float = 5.0
+    dashboard_cache_ttl_seconds: float = 5.0
+    organizations_cache_ttl_seconds: float = 30.0
+    event_bus_backend: str = "memory"
+    event_bus_redis_url: str = "redis://localhost:6379/0"
+    event_bus_channel: str = "orchestrator-events"
+    events_heartbeat_seconds: float = 15.0
+    events_subscriber_queue_size: int = 256
+    call_archive_dir: str = "backend/data/call-archive"
+    call_retention_days: int = 365
+    tts_cache_max_bytes: int = 64 * 1024 * 1024
+    tts_cache_dir: str = ""
+    audio_store_backend: str = "memory"
+    audio_store_max_bytes: int = 256 * 1024 * 1024
+    audio_store_ttl_seconds: float = 1200.0
+    audio_store_dir: str = ""
+    audio_store_redis_url: str = "redis://localhost:6379/0"
+    audio_store_pending_wait_seconds: float = 15.0
+
+    provider_http2_enabled: bool = True
+    provider_http_timeout_seconds: float = 18.0
+    provider_http_connect_timeout_seconds: float = 5.0
+    provider_http_max_connections: int = 100
+    provider_http_max_keepalive_connections: int = 20
+    provider_http_keepalive_expiry_seconds: float = 60.0
+
     def parsed_cors_origins(self) -> list[str]:
         origins = [item.strip() for item in self.cors_allow_origins.split(",") if item.strip()]
 
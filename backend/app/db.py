@@ -1,8 +1,27 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Generator
-
-from sqlalchemy import JSON, Boolean, DateTime, Integer, String, Text, create_engine
+from typing import Generator, Optional
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    create_engine,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session, declarative_base, mapped_column, sessionmaker
 
 from backend.app.api import mock_data
@@ -11,16 +30,60 @@ from backend.app.core.settings import get_settings
 settings = get_settings()
 
 
-def _build_engine() -> tuple:
-    database_url = settings.database_url
-
+def _normalize_database_url(database_url: str) -> str:
     if database_url.startswith("postgres://"):
-        database_url = database_url.replace("postgres://", "postgresql+psycopg://", 1)
-    elif database_url.startswith("postgresql://") and "+" not in database_url.split("://", 1)[0]:
-        database_url = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
+        return database_url.replace("postgres://", "postgresql+psycopg://", 1)
+
+    if database_url.startswith("postgresql://") and "+" not in database_url.split("://", 1)[0]:
+        return database_url.replace("postgresql://", "postgresql+psycopg://", 1)
+
+    return database_url
+
+
+def _is_sqlite_memory_url(database_url: str) -> bool:
+    return database_url in {"sqlite://", "sqlite:///:memory:"} or "mode=memory" in database_url
+
 
-    connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
-    engine = create_engine(database_url, future=True, connect_args=connect_args)
+def _configure_sqlite_connection(dbapi_connection, read_only: bool) -> None:
+    cursor = dbapi_connection.cursor()
+
+    try:
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size_bytes)}")
+
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        else:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
+
+
+def _build_engine(database_url: str = "", read_only: bool = False) -> tuple:
+    database_url = _normalize_database_url(database_url or settings.database_url)
+    is_sqlite = database_url.startswith("sqlite")
+    connect_args = {"check_same_thread": False} if is_sqlite else {}
+    engine_options: dict[str, object] = {
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle_seconds,
+    }
+
+    if not _is_sqlite_memory_url(database_url):
+        engine_options.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout_seconds,
+        )
+
+    engine = create_engine(database_url, future=True, connect_args=connect_args, **engine_options)
+
+    if is_sqlite:
+        event.listen(
+            engine,
+            "connect",
+            lambda dbapi_connection, _: _configure_sqlite_connection(dbapi_connection, read_only),
+        )
 
     return engine, connect_args
 
@@ -50,6 +113,7 @@ class PlatformSettingsRecord(Base):
     enable_barge_in_interruption = mapped_column(Boolean, nullable=False)
     play_latency_filler_phrase_on_timeout = mapped_column(Boolean, nullable=False)
     allow_auto_retry_on_failed_calls = mapped_column(Boolean, nullable=False)
+    version = mapped_column(Integer, nullable=False, default=1, server_default="1")
     updated_at = mapped_column(DateTime(timezone=True), nullable=False)
 
 
@@ -60,27 +124,82 @@ class SettingsAuditRecord(Base):
     event_id = mapped_column(String(64), unique=True, nullable=False)
     changed_at = mapped_column(DateTime(timezone=True), nullable=False)
     actor = mapped_column(String(128), nullable=False)
+    actor_normalized = mapped_column(String(128), nullable=False, default="", server_default="")
+    organization_id = mapped_column(Integer, ForeignKey("organizations.id"), nullable=True)
     reason = mapped_column(Text, nullable=True)
     changed_fields = mapped_column(JSON, nullable=False)
 
 
+class SettingsAuditFieldRecord(Base):
+    """One row per changed field of an audit entry, so field filters can use an index."""
+
+    __tablename__ = "settings_audit_fields"
+
+    event_id = mapped_column(
+        String(64),
+        ForeignKey("settings_audit_log.event_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    field_name = mapped_column(String(128), primary_key=True)
+    field_normalized = mapped_column(String(128), nullable=False)
+
+
+Index(
+    "ix_settings_audit_log_changed_at",
+    SettingsAuditRecord.changed_at.desc(),
+    SettingsAuditRecord.id.desc(),
+)
+Index(
+    "ix_settings_audit_log_actor_changed_at",
+    SettingsAuditRecord.actor_normalized,
+    SettingsAuditRecord.changed_at,
+)
+Index(
+    "ix_settings_audit_log_organization_id_changed_at",
+    SettingsAuditRecord.organization_id,
+    SettingsAuditRecord.changed_at,
+)
+Index(
+    "ix_settings_audit_fields_field_normalized",
+    SettingsAuditFieldRecord.field_normalized,
+    SettingsAuditFieldRecord.event_id,
+)
+
+
+class OrganizationRecord(Base):
+    __tablename__ = "organizations"
+
+    id = mapped_column(Integer, primary_key=True, autoincrement=True)
+    organization_id = mapped_column(String(64), unique=True, nullable=False)
+    name = mapped_column(String(255), nullable=False)
+    name_normalized = mapped_column(String(255), unique=True, nullable=False)
+    subscription_status = mapped_column(String(32), nullable=False, index=True)
+    updated_at = mapped_column(DateTime(timezone=True), nullable=False)
+
+
 class AgentRecord(Base):
     __tablename__ = "agents"
 
     id = mapped_column(Integer, primary_key=True, autoincrement=True)
     agent_id = mapped_column(String(64), unique=True, nullable=False)
     name = mapped_column(String(255), nullable=False)
+    organization_id = mapped_column(Integer, ForeignKey("organizations.id"), nullable=True)
     organization_name = mapped_column(String(255), nullable=False)
     model = mapped_column(String(128), nullable=False)
     voice_id = mapped_column(String(128), nullable=False)
     twilio_number = mapped_column(String(64), nullable=False)
+    twilio_number_e164 = mapped_column(String(32), nullable=False, default="", server_default="", index=True)
     status = mapped_column(String(32), nullable=False)
     prompt = mapped_column(Text, nullable=False)
     prompt_version = mapped_column(String(64), nullable=False)
     average_latency_ms = mapped_column(Integer, nullable=False, default=0)
+    created_at = mapped_column(DateTime(timezone=True), nullable=True)
     updated_at = mapped_column(DateTime(timezone=True), nullable=False)
 
 
+Index("ix_agents_organization_id_status", AgentRecord.organization_id, AgentRecord.status)
+
+
 class CallSessionRecord(Base):
     __tablename__ = "call_sessions"
 
@@ -88,6 +207,8 @@ class CallSessionRecord(Base):
     call_id = mapped_column(String(64), unique=True, nullable=False)
     call_sid = mapped_column(String(128), unique=True, nullable=False)
     agent_name = mapped_column(String(255), nullable=False)
+    agent_name_normalized = mapped_column(String(255), nullable=False, default="", server_default="")
+    organization_id = mapped_column(Integer, ForeignKey("organizations.id"), nullable=True)
     caller_number = mapped_column(String(64), nullable=False)
     started_at = mapped_column(DateTime(timezone=True), nullable=False)
     duration_seconds = mapped_column(Integer, nullable=False, default=0)
@@ -97,9 +218,67 @@ class CallSessionRecord(Base):
     updated_at = mapped_column(DateTime(timezone=True), nullable=False)
 
 
+Index("ix_call_sessions_started_at", CallSessionRecord.started_at.desc(), CallSessionRecord.id.desc())
+Index(
+    "ix_call_sessions_status_started_at",
+    CallSessionRecord.status,
+    CallSessionRecord.started_at,
+    CallSessionRecord.id,
+)
+Index(
+    "ix_call_sessions_agent_name_started_at",
+    CallSessionRecord.agent_name_normalized,
+    CallSessionRecord.started_at,
+    CallSessionRecord.id,
+)
+Index(
+    "ix_call_sessions_organization_id_started_at",
+    CallSessionRecord.organization_id,
+    CallSessionRecord.started_at,
+    CallSessionRecord.id,
+)
+
+
+class UsageDailyRecord(Base):
+    """Per (organization, agent, UTC day) call totals, kept in step with call_sessions."""
+
+    __tablename__ = "usage_daily"
+
+    # organizations.id of the call, or 0 for calls without an organization.
+    organization_id = mapped_column(Integer, primary_key=True)
+    agent_name_normalized = mapped_column(String(255), primary_key=True)
+    day = mapped_column(Date, primary_key=True)
+    call_count = mapped_column(Integer, nullable=False, default=0)
+    duration_seconds = mapped_column(Integer, nullable=False, default=0)
+
+
+Index("ix_usage_daily_day", UsageDailyRecord.day)
+
+
+class IdSequenceRecord(Base):
+    __tablename__ = "id_sequences"
+
+    name = mapped_column(String(64), primary_key=True)
+    value = mapped_column(Integer, nullable=False, default=0)
+
+
+ID_SEQUENCE_COLUMNS = {
+    "org": OrganizationRecord.organization_id,
+    "agent": AgentRecord.agent_id,
+    "call": CallSessionRecord.call_id,
+    "settings-audit": SettingsAuditRecord.event_id,
+}
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
 _ensure_sqlite_parent_dir()
 engine, _ = _build_engine()
+read_engine = _build_engine(settings.database_read_url, read_only=True)[0] if settings.database_read_url else engine
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+ReadSessionLocal = sessionmaker(bind=read_engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -111,8 +290,245 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db() -> Generator[Session, None, None]:
+    """Session for list and analytics routes; uses DATABASE_READ_URL when a replica is configured."""
+    db = ReadSessionLocal()
+
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def normalize_e164(value: str) -> str:
+    digits = "".join(char for char in value if char.isdigit())
+    return f"+{digits}" if digits else ""
+
+
+def normalize_agent_name(value: str) -> str:
+    return value.strip().lower()
+
+
+def normalize_organization_name(value: str) -> str:
+    return " ".join(value.split()).lower()
+
+
+def normalize_actor(value: str) -> str:
+    return value.strip().lower()
+
+
+def settings_audit_field_records(event_id: str, changed_fields: list[str]) -> list[SettingsAuditFieldRecord]:
+    return [
+        SettingsAuditFieldRecord(event_id=event_id, field_name=field, field_normalized=field.strip().lower())
+        for field in dict.fromkeys(changed_fields)
+    ]
+
+
+def _upgrade_schema() -> set[tuple[str, str]]:
+    """Add columns and indexes introduced after a table was first created; returns the added columns."""
+    inspector = inspect(engine)
+    added_columns = set()
+
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+
+                column_type = column.type.compile(dialect=engine.dialect)
+                default_clause = ""
+
+                if column.server_default is not None:
+                    default_clause = f" DEFAULT '{column.server_default.arg}'"
+
+                connection.execute(
+                    text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}{default_clause}")
+                )
+                added_columns.add((table.name, column.name))
+
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+
+    return added_columns
+
+
+def _backfill_derived_columns(db: Session, batch_size: int = 1000) -> None:
+    for agent in db.query(AgentRecord).filter(AgentRecord.twilio_number_e164 == "").all():
+        agent.twilio_number_e164 = normalize_e164(agent.twilio_number)
+
+    _backfill_settings_audit(db, batch_size)
+    _backfill_agent_organizations(db)
+
+    last_id = 0
+
+    while True:
+        calls = (
+            db.query(CallSessionRecord)
+            .filter(CallSessionRecord.id > last_id, CallSessionRecord.agent_name_normalized == "")
+            .order_by(CallSessionRecord.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+
+        if not calls:
+            break
+
+        for call in calls:
+            call.agent_name_normalized = normalize_agent_name(call.agent_name)
+
+        last_id = calls[-1].id
+        db.flush()
+
+
+def _backfill_agent_organizations(db: Session) -> None:
+    agents = db.query(AgentRecord).filter(AgentRecord.organization_id.is_(None)).all()
+
+    if not agents:
+        return
+
+    organizations = {organization.name_normalized: organization for organization in db.query(OrganizationRecord).all()}
+    next_suffix = _max_numeric_suffix(db, OrganizationRecord.organization_id)
+
+    for agent in agents:
+        name_normalized = normalize_organization_name(agent.organization_name)
+        organization = organizations.get(name_normalized)
+
+        if organization is None:
+            next_suffix += 1
+            organization = OrganizationRecord(
+                organization_id=f"org-{next_suffix}",
+                name=agent.organization_name.strip(),
+                name_normalized=name_normalized,
+                subscription_status="trial",
+                updated_at=datetime.now(timezone.utc),
+            )
+            db.add(organization)
+            db.flush()
+            organizations[name_normalized] = organization
+
+        agent.organization_id = organization.id
+
+
+def _backfill_call_organizations(db: Session) -> None:
+    db.flush()
+    agent_organization_id = (
+        select(AgentRecord.organization_id)
+        .where(
+            func.lower(func.trim(AgentRecord.name)) == CallSessionRecord.agent_name_normalized,
+            AgentRecord.created_at.is_(None) | (AgentRecord.created_at <= CallSessionRecord.started_at),
+        )
+        .order_by(AgentRecord.id.asc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(CallSessionRecord)
+        .where(CallSessionRecord.organization_id.is_(None))
+        .values(organization_id=agent_organization_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _backfill_settings_audit(db: Session, batch_size: int) -> None:
+    indexed_events = select(SettingsAuditFieldRecord.event_id).distinct()
+    last_id = 0
+
+    while True:
+        entries = (
+            db.query(SettingsAuditRecord)
+            .filter(
+                SettingsAuditRecord.id > last_id,
+                (SettingsAuditRecord.actor_normalized == "") | SettingsAuditRecord.event_id.not_in(indexed_events),
+            )
+            .order_by(SettingsAuditRecord.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+
+        if not entries:
+            break
+
+        for entry in entries:
+            entry.actor_normalized = normalize_actor(entry.actor)
+            db.query(SettingsAuditFieldRecord).filter(SettingsAuditFieldRecord.event_id == entry.event_id).delete()
+            db.add_all(settings_audit_field_records(entry.event_id, list(entry.changed_fields or [])))
+
+        last_id = entries[-1].id
+        db.flush()
+
+
+def dialect_upsert_insert(db: Session):
+    """The dialect's ``insert`` construct supporting ``on_conflict_do_update``, or None if it has none."""
+    return UPSERT_INSERTS.get(db.get_bind().dialect.name)
+
+
+def _utc_date(db: Session, column):
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date(func.timezone("UTC", column))
+
+    # SQLite keeps the UTC wall-clock time the application wrote.
+    return func.date(column)
+
+
+def rebuild_usage_daily(db: Session, start_day: Optional[date] = None) -> int:
+    """Recompute the usage_daily rollup from call_sessions with one INSERT ... SELECT."""
+    organization_id = func.coalesce(CallSessionRecord.organization_id, 0)
+    day = _utc_date(db, CallSessionRecord.started_at)
+    rollup = select(
+        organization_id,
+        CallSessionRecord.agent_name_normalized,
+        day,
+        func.count(CallSessionRecord.id).filter(CallSessionRecord.duration_seconds > 0),
+        func.sum(CallSessionRecord.duration_seconds),
+    ).group_by(organization_id, CallSessionRecord.agent_name_normalized, day)
+    stale_rows = db.query(UsageDailyRecord)
+
+    if start_day is not None:
+        rollup = rollup.where(
+            CallSessionRecord.started_at >= datetime(start_day.year, start_day.month, start_day.day, tzinfo=timezone.utc)
+        )
+        stale_rows = stale_rows.filter(UsageDailyRecord.day >= start_day)
+
+    stale_rows.delete(synchronize_session=False)
+    db.execute(
+        insert(UsageDailyRecord).from_select(
+            ["organization_id", "agent_name_normalized", "day", "call_count", "duration_seconds"],
+            rollup,
+        )
+    )
+
+    return db.query(UsageDailyRecord).count()
+
+
+def _max_numeric_suffix(db: Session, column) -> int:
+    max_value = 0
+
+    for (external_id,) in db.query(column).all():
+        if not isinstance(external_id, str):
+            continue
+
+        try:
+            max_value = max(max_value, int(external_id.split("-")[-1]))
+        except ValueError:
+            continue
+
+    return max_value
+
+
+def _seed_id_sequences(db: Session) -> None:
+    for name, column in ID_SEQUENCE_COLUMNS.items():
+        if db.get(IdSequenceRecord, name) is None:
+            db.add(IdSequenceRecord(name=name, value=_max_numeric_suffix(db, column)))
+
+
 def initialize_database() -> None:
     Base.metadata.create_all(bind=engine)
+    added_columns = _upgrade_schema()
 
     with SessionLocal() as db:
         settings_exists = db.query(PlatformSettingsRecord).first()
@@ -142,11 +558,26 @@ def initialize_database() -> None:
                         event_id=seed_entry.id,
                         changed_at=datetime.fromisoformat(seed_entry.changed_at.replace("Z", "+00:00")),
                         actor=seed_entry.actor,
+                        actor_normalized=normalize_actor(seed_entry.actor),
                         reason=seed_entry.reason,
                         changed_fields=seed_entry.changed_fields,
                     )
                 )
 
+        organizations_exist = db.query(OrganizationRecord).first()
+
+        if organizations_exist is None:
+            for organization in mock_data.ORGANIZATIONS:
+                db.add(
+                    OrganizationRecord(
+                        organization_id=organization.id,
+                        name=organization.name,
+                        name_normalized=normalize_organization_name(organization.name),
+                        subscription_status=organization.subscription_status,
+                        updated_at=datetime.now(timezone.utc),
+                    )
+                )
+
         agents_exist = db.query(AgentRecord).first()
 
         if agents_exist is None:
@@ -159,6 +590,7 @@ def initialize_database() -> None:
                         model=agent.model,
                         voice_id=agent.voice_id,
                         twilio_number=agent.twilio_number,
+                        twilio_number_e164=normalize_e164(agent.twilio_number),
                         status=agent.status,
                         prompt=agent.prompt,
                         prompt_version=agent.prompt_version,
@@ -179,6 +611,7 @@ def initialize_database() -> None:
                         call_id=call.id,
                         call_sid=f"seed-{call.id}",
                         agent_name=call.agent_name,
+                        agent_name_normalized=normalize_agent_name(call.agent_name),
                         caller_number=call.caller_number,
                         started_at=parsed_started_at,
                         duration_seconds=call.duration_seconds,
@@ -189,4 +622,17 @@ def initialize_database() -> None:
                     )
                 )
 
+        db.flush()
+        _backfill_derived_columns(db)
+
+        if calls_exist is None or ("call_sessions", "organization_id") in added_columns:
+            # Calls only lack organization_id when seeded or created before the column existed.
+            _backfill_call_organizations(db)
+
+        db.flush()
+        _seed_id_sequences(db)
+
+        if db.query(UsageDailyRecord).first() is None:
+            rebuild_usage_daily(db)
+
         db.commit()
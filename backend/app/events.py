@@ -0,0 +1,147 @@
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from backend.app.core.settings import Settings, get_settings
+
+EVENT_BUS_BACKENDS = ("memory", "redis")
+CALL_CREATED_EVENT = "call-created"
+CALL_STATUS_CHANGED_EVENT = "call-status-changed"
+AGENT_CHANGED_EVENT = "agent-changed"
+settings = get_settings()
+
+
+def encode_event(event_type: str, data: dict[str, Any]) -> bytes:
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    return f"event: {event_type}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class _Subscriber:
+    __slots__ = ("queue", "loop")
+
+    def __init__(self, queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> None:
+        self.queue = queue
+        self.loop = loop
+
+
+class EventBus:
+    """Fans encoded SSE frames out to the subscribers connected to this worker."""
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._subscribers: set[_Subscriber] = set()
+        self._lock = threading.Lock()
+
+    def publish(self, event_type: str, data: dict[str, Any]) -> None:
+        self.deliver(encode_event(event_type, data))
+
+    def deliver(self, frame: bytes) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(self._offer, subscriber.queue, frame)
+            except RuntimeError:
+                self._discard(subscriber)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue]:
+        subscriber = _Subscriber(asyncio.Queue(maxsize=self.queue_size), asyncio.get_running_loop())
+
+        with self._lock:
+            self._subscribers.add(subscriber)
+
+        try:
+            yield subscriber.queue
+        finally:
+            self._discard(subscriber)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def close(self) -> None:
+        return None
+
+    def _discard(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, frame: bytes) -> None:
+        if queue.full():
+            queue.get_nowait()
+
+        queue.put_nowait(frame)
+
+
+class RedisEventBus(EventBus):
+    """Relays frames through a Redis pub/sub channel so every worker's subscribers see them."""
+
+    def __init__(self, queue_size: int, url: str, channel: str) -> None:
+        super().__init__(queue_size)
+
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("EVENT_BUS_BACKEND=redis requires the 'redis' package") from exc
+
+        self.client = redis.Redis.from_url(url)
+        self.channel = channel
+        self._listener: Optional[threading.Thread] = None
+        self._pubsub = None
+
+    def publish(self, event_type: str, data: dict[str, Any]) -> None:
+        self.client.publish(self.channel, encode_event(event_type, data))
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue]:
+        self._ensure_listener()
+
+        with super().subscribe() as queue:
+            yield queue
+
+    def close(self) -> None:
+        if self._pubsub is not None:
+            self._pubsub.close()
+
+    def _ensure_listener(self) -> None:
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+
+            self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(self.channel)
+            self._listener = threading.Thread(target=self._listen, name="event-bus-listener", daemon=True)
+            self._listener.start()
+
+    def _listen(self) -> None:
+        try:
+            for message in self._pubsub.listen():
+                if message.get("type") == "message":
+                    self.deliver(message["data"])
+        except Exception:
+            # Closed on shutdown or connection lost; the next subscriber starts a new listener.
+            return
+
+
+def build_event_bus(settings: Settings) -> EventBus:
+    backend = settings.event_bus_backend.strip().lower()
+
+    if backend not in EVENT_BUS_BACKENDS:
+        raise ValueError(f"Unsupported EVENT_BUS_BACKEND: {settings.event_bus_backend}")
+
+    if backend == "redis":
+        return RedisEventBus(
+            settings.events_subscriber_queue_size,
+            settings.event_bus_redis_url,
+            settings.event_bus_channel,
+        )
+
+    return EventBus(settings.events_subscriber_queue_size)
+
+
+event_bus = build_event_bus(settings)
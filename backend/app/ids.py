@@ -0,0 +1,24 @@
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from backend.app.db import IdSequenceRecord
+
+
+def allocate_ids(db: Session, sequence: str, count: int = 1) -> list[int]:
+    """Reserve ``count`` consecutive values from a counter row in a single statement."""
+    last_value = db.execute(
+        update(IdSequenceRecord)
+        .where(IdSequenceRecord.name == sequence)
+        .values(value=IdSequenceRecord.value + count)
+        .returning(IdSequenceRecord.value)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+
+    if last_value is None:
+        raise RuntimeError(f"Unknown id sequence: {sequence}")
+
+    return list(range(last_value - count + 1, last_value + 1))
+
+
+def allocate_external_id(db: Session, sequence: str) -> str:
+    return f"{sequence}-{allocate_ids(db, sequence)[0]}"
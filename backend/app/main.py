@@ -8,13 +8,17 @@ from backend.app.api.routes import (
     auth_router,
     calls_router,
     dashboard_router,
+    events_router,
     health_router,
     organizations_router,
     settings_router,
     twilio_router,
 )
+from backend.app.api.routes.twilio import callback_buffer
 from backend.app.core.settings import get_settings
 from backend.app.db import initialize_database
+from backend.app.events import event_bus
+from backend.app.providers.http import close_provider_clients, open_provider_clients
 
 settings = get_settings()
 
@@ -22,7 +26,16 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     initialize_database()
+    open_provider_clients()
+
+    if settings.twilio_callback_write_behind_enabled:
+        # Starting replays WAL segments left by a crashed worker.
+        callback_buffer.start()
+
     yield
+    callback_buffer.close()
+    await close_provider_clients()
+    event_bus.close()
 
 app = FastAPI(
     title=settings.app_name,
@@ -38,6 +51,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(health_router)
@@ -46,5 +60,6 @@ app.include_router(organizations_router, prefix="/api")
 app.include_router(agents_router, prefix="/api")
 app.include_router(calls_router, prefix="/api")
 app.include_router(dashboard_router, prefix="/api")
+app.include_router(events_router, prefix="/api")
 app.include_router(settings_router, prefix="/api")
 app.include_router(twilio_router, prefix="/api")
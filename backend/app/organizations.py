@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.app.db import OrganizationRecord, normalize_organization_name
+from backend.app.ids import allocate_external_id
+from backend.app.schemas import SubscriptionStatus
+
+
+def ensure_organization(db: Session, name: str) -> OrganizationRecord:
+    """Return the organization with this name, creating it as a trial tenant if it is new."""
+    name_normalized = normalize_organization_name(name)
+    organization = db.query(OrganizationRecord).filter(OrganizationRecord.name_normalized == name_normalized).first()
+
+    if organization is not None:
+        return organization
+
+    try:
+        with db.begin_nested():
+            organization = OrganizationRecord(
+                organization_id=allocate_external_id(db, "org"),
+                name=name.strip(),
+                name_normalized=name_normalized,
+                subscription_status=SubscriptionStatus.trial.value,
+                updated_at=datetime.now(timezone.utc),
+            )
+            db.add(organization)
+    except IntegrityError:
+        organization = (
+            db.query(OrganizationRecord).filter(OrganizationRecord.name_normalized == name_normalized).one()
+        )
+
+    return organization
@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.core.settings import get_settings
+from backend.app.db import PlatformSettingsRecord
+
+settings = get_settings()
+
+
+class PlatformSettingsSnapshot:
+    """Immutable copy of the platform settings row at one version."""
+
+    __slots__ = (
+        "version",
+        "openai_api_key",
+        "deepgram_api_key",
+        "twilio_account_sid",
+        "rime_api_key",
+        "enable_barge_in_interruption",
+        "play_latency_filler_phrase_on_timeout",
+        "allow_auto_retry_on_failed_calls",
+    )
+
+    def __init__(self, record: PlatformSettingsRecord) -> None:
+        self.version = record.version
+        self.openai_api_key = record.openai_api_key
+        self.deepgram_api_key = record.deepgram_api_key
+        self.twilio_account_sid = record.twilio_account_sid
+        self.rime_api_key = record.rime_api_key
+        self.enable_barge_in_interruption = record.enable_barge_in_interruption
+        self.play_latency_filler_phrase_on_timeout = record.play_latency_filler_phrase_on_timeout
+        self.allow_auto_retry_on_failed_calls = record.allow_auto_retry_on_failed_calls
+
+
+class PlatformSettingsCache:
+    """In-process platform settings snapshot, reloaded when the row's version column changes."""
+
+    def __init__(self, check_interval_seconds: float) -> None:
+        self.check_interval_seconds = check_interval_seconds
+        self._snapshot: Optional[PlatformSettingsSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> Optional[PlatformSettingsSnapshot]:
+        snapshot = self._snapshot
+
+        if snapshot is not None and time.monotonic() - self._checked_at < self.check_interval_seconds:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+
+            if snapshot is not None and time.monotonic() - self._checked_at < self.check_interval_seconds:
+                return snapshot
+
+            version = db.execute(
+                select(PlatformSettingsRecord.version).order_by(PlatformSettingsRecord.id.asc()).limit(1)
+            ).scalar_one_or_none()
+
+            if version is None:
+                return None
+
+            if snapshot is None or snapshot.version != version:
+                record = db.query(PlatformSettingsRecord).order_by(PlatformSettingsRecord.id.asc()).first()
+                snapshot = PlatformSettingsSnapshot(record) if record is not None else None
+                self._snapshot = snapshot
+
+            self._checked_at = time.monotonic()
+            return snapshot
+
+    def store(self, record: PlatformSettingsRecord) -> PlatformSettingsSnapshot:
+        snapshot = PlatformSettingsSnapshot(record)
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version <= snapshot.version:
+                self._snapshot = snapshot
+                self._checked_at = time.monotonic()
+
+        return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._checked_at = 0.0
+
+
+platform_settings_cache = PlatformSettingsCache(settings.platform_settings_check_seconds)
@@ -0,0 +1,52 @@
+import httpx
+
+from backend.app.core.settings import get_settings
+
+OPENAI_PROVIDER = "openai"
+RIME_PROVIDER = "rime"
+PROVIDER_BASE_URLS = {
+    OPENAI_PROVIDER: "https://api.openai.com",
+    RIME_PROVIDER: "https://users.rime.ai",
+}
+
+settings = get_settings()
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _build_client(provider: str) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=PROVIDER_BASE_URLS[provider],
+        http2=settings.provider_http2_enabled,
+        timeout=httpx.Timeout(
+            settings.provider_http_timeout_seconds,
+            connect=settings.provider_http_connect_timeout_seconds,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.provider_http_max_connections,
+            max_keepalive_connections=settings.provider_http_max_keepalive_connections,
+            keepalive_expiry=settings.provider_http_keepalive_expiry_seconds,
+        ),
+    )
+
+
+def get_provider_client(provider: str) -> httpx.AsyncClient:
+    client = _clients.get(provider)
+
+    if client is None or client.is_closed:
+        client = _build_client(provider)
+        _clients[provider] = client
+
+    return client
+
+
+def open_provider_clients() -> None:
+    for provider in PROVIDER_BASE_URLS:
+        get_provider_client(provider)
+
+
+async def close_provider_clients() -> None:
+    clients = list(_clients.values())
+    _clients.clear()
+
+    for client in clients:
+        await client.aclose()
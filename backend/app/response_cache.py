@@ -0,0 +1,103 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from fastapi import Request, Response, status
+
+DASHBOARD_CACHE_TAG = "dashboard"
+ORGANIZATIONS_CACHE_TAG = "organizations"
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+
+class CachedResponse:
+    __slots__ = ("body", "etag", "expires_at")
+
+    def __init__(self, body: bytes, expires_at: float) -> None:
+        self.body = body
+        self.etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """Per-process LRU of rendered JSON bodies, grouped by tag for invalidation."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, tag: str, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get((tag, key))
+
+            if entry is None:
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                del self._entries[(tag, key)]
+                return None
+
+            self._entries.move_to_end((tag, key))
+            return entry
+
+    def put(self, tag: str, key: str, body: bytes, ttl_seconds: float) -> CachedResponse:
+        now = time.monotonic()
+        entry = CachedResponse(body, now + ttl_seconds)
+
+        with self._lock:
+            for cache_key in [cache_key for cache_key, cached in self._entries.items() if cached.expires_at <= now]:
+                del self._entries[cache_key]
+
+            self._entries[(tag, key)] = entry
+            self._entries.move_to_end((tag, key))
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def invalidate(self, *tags: str) -> None:
+        with self._lock:
+            for cache_key in [cache_key for cache_key in self._entries if cache_key[0] in tags]:
+                del self._entries[cache_key]
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _etag_matches(header_value: str, etag: str) -> bool:
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header_value.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cached_json_response(
+    request: Request,
+    tag: str,
+    key: str,
+    ttl_seconds: float,
+    render: Callable[[], bytes],
+) -> Response:
+    """Serve ``render()`` from the cache under ``key``, answering matching If-None-Match with 304."""
+    entry = response_cache.get(tag, key) if ttl_seconds > 0 else None
+
+    if entry is None:
+        body = render()
+        entry = response_cache.put(tag, key, body, ttl_seconds) if ttl_seconds > 0 else CachedResponse(body, 0.0)
+
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match and _etag_matches(if_none_match, entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+response_cache = ResponseCache()
@@ -5,6 +5,7 @@ from backend.app.schemas.domain import (
     AgentUpdate,
     AuthLoginRequest,
     AuthLoginResponse,
+    CallExportFormat,
     CallSession,
     CallStatus,
     DashboardKpi,
@@ -28,6 +29,7 @@ __all__ = [
     "AgentUpdate",
     "AuthLoginRequest",
     "AuthLoginResponse",
+    "CallExportFormat",
     "CallSession",
     "CallStatus",
     "DashboardKpi",
@@ -51,6 +51,12 @@ class CallStatus(str, Enum):
     failed = "failed"
 
 
+class CallExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+    parquet = "parquet"
+
+
 class Sentiment(str, Enum):
     positive = "positive"
     neutral = "neutral"
@@ -0,0 +1,132 @@
+from datetime import date, datetime, timezone
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.app.call_archive import call_archive
+from backend.app.db import (
+    CallSessionRecord,
+    SessionLocal,
+    UsageDailyRecord,
+    dialect_upsert_insert,
+    initialize_database,
+    rebuild_usage_daily,
+)
+
+UsageKey = tuple[int, str, date]
+USAGE_KEY_COLUMNS = ("organization_id", "agent_name_normalized", "day")
+
+
+def _usage_day(started_at: datetime) -> date:
+    if started_at.tzinfo is None:
+        return started_at.date()
+
+    return started_at.astimezone(timezone.utc).date()
+
+
+def _increment_usage(db: Session, key: dict[str, object], calls: int, seconds: int) -> bool:
+    result = db.execute(
+        update(UsageDailyRecord)
+        .where(*(getattr(UsageDailyRecord, column) == value for column, value in key.items()))
+        .values(
+            call_count=UsageDailyRecord.call_count + calls,
+            duration_seconds=UsageDailyRecord.duration_seconds + seconds,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    return result.rowcount > 0
+
+
+def _add_usage_row(db: Session, key: dict[str, object], calls: int, seconds: int) -> None:
+    if _increment_usage(db, key, calls, seconds):
+        return
+
+    try:
+        with db.begin_nested():
+            db.add(UsageDailyRecord(**key, call_count=calls, duration_seconds=seconds))
+    except IntegrityError:
+        _increment_usage(db, key, calls, seconds)
+
+
+def add_call_duration(
+    deltas: dict[UsageKey, list[int]],
+    call_session: CallSessionRecord,
+    previous_duration: int,
+) -> None:
+    """Sum the change in a call's duration into ``deltas`` under its usage_daily key."""
+    seconds = call_session.duration_seconds - previous_duration
+    calls = int(call_session.duration_seconds > 0) - int(previous_duration > 0)
+
+    if seconds == 0 and calls == 0:
+        return
+
+    key = (call_session.organization_id or 0, call_session.agent_name_normalized, _usage_day(call_session.started_at))
+    totals = deltas.setdefault(key, [0, 0])
+    totals[0] += calls
+    totals[1] += seconds
+
+
+def apply_usage_deltas(db: Session, deltas: dict[UsageKey, list[int]]) -> None:
+    """Add summed deltas to usage_daily within the caller's transaction."""
+    rows = [
+        {**dict(zip(USAGE_KEY_COLUMNS, key)), "call_count": calls, "duration_seconds": seconds}
+        for key, (calls, seconds) in deltas.items()
+        if calls or seconds
+    ]
+
+    if not rows:
+        return
+
+    insert = dialect_upsert_insert(db)
+
+    if insert is None:
+        for row in rows:
+            key = {column: row[column] for column in USAGE_KEY_COLUMNS}
+            _add_usage_row(db, key, row["call_count"], row["duration_seconds"])
+
+        return
+
+    table = UsageDailyRecord.__table__
+    statement = insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c[column] for column in USAGE_KEY_COLUMNS],
+        set_={
+            "call_count": table.c.call_count + statement.excluded.call_count,
+            "duration_seconds": table.c.duration_seconds + statement.excluded.duration_seconds,
+        },
+    )
+    db.execute(statement, rows)
+
+
+def record_call_duration(db: Session, call_session: CallSessionRecord, previous_duration: int) -> None:
+    """Apply the change in a call's duration to its usage_daily row within the caller's transaction."""
+    deltas: dict[UsageKey, list[int]] = {}
+    add_call_duration(deltas, call_session, previous_duration)
+    apply_usage_deltas(db, deltas)
+
+
+def usage_seconds_by_day(db: Session, start_day: date) -> dict[date, int]:
+    rows = db.execute(
+        select(UsageDailyRecord.day, func.sum(UsageDailyRecord.duration_seconds))
+        .where(UsageDailyRecord.day >= start_day)
+        .group_by(UsageDailyRecord.day)
+    ).all()
+
+    return {day: seconds or 0 for day, seconds in rows}
+
+
+def main() -> None:
+    initialize_database()
+
+    with SessionLocal() as db:
+        # Archived calls are no longer in call_sessions, so their days keep the rollup they had.
+        rows = rebuild_usage_daily(db, call_archive.archived_through())
+        db.commit()
+
+    print(f"Rebuilt usage_daily: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
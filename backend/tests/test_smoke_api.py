@@ -1,9 +1,50 @@
+import asyncio
+import csv
+import io
+import json
+import re
+from datetime import date, datetime, timezone
 from uuid import uuid4
 
+import pytest
 from fastapi.testclient import TestClient
-
-from backend.app.db import CallSessionRecord, PlatformSettingsRecord, SessionLocal, initialize_database
+from sqlalchemy import event
+
+from backend.app.agent_config import AgentConfigCache
+from backend.app.api.routes import calls as calls_routes
+from backend.app.api.routes import events as events_routes
+from backend.app.api.routes import twilio as twilio_routes
+from backend.app.audio import (
+    AudioBlob,
+    DirectoryAudioBlobStore,
+    MemoryAudioBlobStore,
+    SynthesisCache,
+    synthesis_cache_key,
+)
+from backend.app.audit import SettingsAuditDraft, record_settings_audit
+from backend.app import call_archive as call_archive_module
+from backend.app.call_archive import CallArchive
+from backend.app.call_sessions import upsert_call_session
+from backend.app.callback_buffer import CallbackBuffer
+from backend.app import db as db_module
+from backend.app.db import (
+    AgentRecord,
+    CallSessionRecord,
+    OrganizationRecord,
+    PlatformSettingsRecord,
+    SessionLocal,
+    SettingsAuditFieldRecord,
+    UsageDailyRecord,
+    engine,
+    initialize_database,
+    rebuild_usage_daily,
+)
+from backend.app.events import event_bus
+from backend.app.ids import allocate_external_id, allocate_ids
+from backend.app.platform_settings import PlatformSettingsCache, platform_settings_cache
 from backend.app.main import app
+from backend.app.providers.http import OPENAI_PROVIDER, RIME_PROVIDER, get_provider_client
+from backend.app.response_cache import ResponseCache, response_cache
 
 
 initialize_database()
@@ -33,6 +74,16 @@ def test_health_endpoint() -> None:
     assert "environment" in payload
 
 
+def test_sqlite_connections_use_wal_tuning() -> None:
+    if engine.dialect.name != "sqlite":
+        return
+
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+        assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() >= 1000
+
+
 def test_organizations_endpoint() -> None:
     response = client.get("/api/organizations")
 
@@ -51,6 +102,74 @@ def test_organizations_filter_by_subscription_status() -> None:
     assert all(org["subscriptionStatus"] == "active" for org in organizations)
 
 
+def test_organizations_are_created_for_new_agent_tenants() -> None:
+    tenant_name = f"Tenant {uuid4().hex[:8]}"
+    create_response = client.post(
+        "/api/agents",
+        json={
+            "name": "Tenant Desk",
+            "organizationName": tenant_name,
+            "model": "gpt-4.1-mini",
+            "voiceId": "rime-luna",
+            "twilioNumber": "+1 (212) 555-0199",
+            "status": "active",
+            "prompt": "You are a tenant desk.",
+            "promptVersion": "v1.0",
+        },
+    )
+    assert create_response.status_code == 201
+
+    trial_organizations = client.get(
+        "/api/organizations",
+        params={"subscriptionStatus": "trial", "limit": 500},
+    ).json()
+    tenant = next(org for org in trial_organizations if org["name"] == tenant_name)
+    assert tenant["id"].startswith("org-")
+    assert tenant["activeAgents"] == 1
+    assert tenant["monthlyMinutes"] == 0
+
+    client.patch(f"/api/agents/{create_response.json()['id']}", json={"status": "offline"})
+    trial_organizations = client.get(
+        "/api/organizations",
+        params={"subscriptionStatus": "trial", "limit": 500},
+    ).json()
+    assert next(org for org in trial_organizations if org["name"] == tenant_name)["activeAgents"] == 0
+
+    first_page = client.get("/api/organizations", params={"limit": 1}).json()
+    second_page = client.get("/api/organizations", params={"limit": 1, "offset": 1}).json()
+    assert len(first_page) == 1 and len(second_page) == 1
+    assert first_page[0]["id"] != second_page[0]["id"]
+
+
+def test_organization_minutes_include_agents_with_variant_names() -> None:
+    tenant_name = f"Variant Tenant {uuid4().hex[:8]}"
+    number = f"+1415555{int(uuid4().int % 9000) + 1000:04d}"
+
+    for organization_name in (tenant_name, f"  {tenant_name.upper()} "):
+        client.post(
+            "/api/agents",
+            json={
+                "name": f"Variant Desk {uuid4().hex[:6]}",
+                "organizationName": organization_name,
+                "model": "gpt-4.1-mini",
+                "voiceId": "rime-luna",
+                "twilioNumber": number if organization_name != tenant_name else "+1 (212) 555-0142",
+                "status": "active",
+                "prompt": "You are a variant desk.",
+                "promptVersion": "v1.0",
+            },
+        )
+
+    call_sid = f"CA-variant-{uuid4().hex[:12]}"
+    client.post("/api/twilio/voice", data={"CallSid": call_sid, "From": "+14155550111", "To": number})
+    client.post("/api/twilio/status", data={"CallSid": call_sid, "CallStatus": "completed", "CallDuration": "600"})
+
+    organizations = client.get("/api/organizations", params={"subscriptionStatus": "trial", "limit": 500}).json()
+    tenant = next(org for org in organizations if org["name"] == tenant_name)
+    assert tenant["monthlyMinutes"] == 10
+    assert tenant["activeAgents"] == 2
+
+
 def test_agents_endpoint() -> None:
     response = client.get("/api/agents")
 
@@ -158,6 +277,108 @@ def test_delete_agent_endpoint() -> None:
     assert all(agent["id"] != agent_id for agent in agents)
 
 
+def test_twilio_voice_routes_by_number_and_follows_agent_updates() -> None:
+    create_response = client.post(
+        "/api/agents",
+        json={
+            "name": "Routing Desk",
+            "organizationName": "Prime Auto Group",
+            "model": "gpt-4.1-mini",
+            "voiceId": "rime-luna",
+            "twilioNumber": "+1 (628) 555-0101",
+            "status": "active",
+            "prompt": "You are a routing desk.",
+            "promptVersion": "v1.0",
+            "averageLatencyMs": 500,
+        },
+    )
+    assert create_response.status_code == 201
+    agent_id = create_response.json()["id"]
+
+    first_sid = f"CA-test-{uuid4().hex[:12]}"
+    first_response = client.post(
+        "/api/twilio/voice",
+        data={"CallSid": first_sid, "From": "+14155550999", "To": "+16285550101"},
+    )
+    assert first_response.status_code == 200
+
+    update_response = client.patch(f"/api/agents/{agent_id}", json={"twilioNumber": "+1 628-555-0202"})
+    assert update_response.status_code == 200
+
+    second_sid = f"CA-test-{uuid4().hex[:12]}"
+    second_response = client.post(
+        "/api/twilio/voice",
+        data={"CallSid": second_sid, "From": "+14155550999", "To": "+16285550202"},
+    )
+    assert second_response.status_code == 200
+
+    with SessionLocal() as db:
+        first_call = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == first_sid).first()
+        second_call = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == second_sid).first()
+        assert first_call is not None and first_call.agent_name == "Routing Desk"
+        assert second_call is not None and second_call.agent_name == "Routing Desk"
+
+
+def test_agent_config_cache_reloads_only_changed_agents() -> None:
+    cache = AgentConfigCache()
+    agent_id = f"agent-config-{uuid4().hex[:8]}"
+
+    with SessionLocal() as db:
+        agent = AgentRecord(
+            agent_id=agent_id,
+            name="Config Probe",
+            organization_name="Dental Clinic X",
+            model="gpt-4.1-mini",
+            voice_id="rime-luna",
+            twilio_number="",
+            status="inactive",
+            prompt="Original probe prompt.",
+            prompt_version="v1.0",
+            updated_at=datetime.now(timezone.utc),
+        )
+        db.add(agent)
+        db.commit()
+
+        try:
+            config = cache.get(db, agent.id)
+            assert config is not None and config.prompt == agent.prompt
+            assert cache.get(db, agent.id) is config
+
+            agent.prompt = "Prompt rewritten by a sibling worker."
+            agent.prompt_version = "v9.9"
+            agent.updated_at = datetime.now(timezone.utc)
+            db.commit()
+
+            reloaded = cache.get(db, agent.id)
+            assert reloaded is not config
+            assert (reloaded.prompt, reloaded.prompt_version) == ("Prompt rewritten by a sibling worker.", "v9.9")
+            assert cache.get(db, agent.id) is reloaded
+
+            cache.invalidate(agent_id)
+            assert cache.get(db, agent.id) is not reloaded
+        finally:
+            db.delete(agent)
+            db.commit()
+
+
+def test_id_allocation_is_monotonic_and_batched() -> None:
+    with SessionLocal() as db:
+        first = allocate_external_id(db, "call")
+        batch = allocate_ids(db, "call", count=3)
+        db.commit()
+
+    first_number = int(first.split("-")[-1])
+    assert batch == [first_number + 1, first_number + 2, first_number + 3]
+
+    with SessionLocal() as db:
+        assert allocate_ids(db, "call") == [first_number + 4]
+        db.rollback()
+
+    with SessionLocal() as db:
+        assert allocate_ids(db, "call") == [first_number + 4]
+        db.commit()
+
+
 def test_calls_endpoint_with_limit() -> None:
     response = client.get("/api/calls", params={"limit": 2})
 
@@ -167,6 +388,101 @@ def test_calls_endpoint_with_limit() -> None:
     assert "agentName" in calls[0]
 
 
+def test_calls_endpoint_pages_with_cursor() -> None:
+    full_response = client.get("/api/calls", params={"limit": 200})
+    assert full_response.status_code == 200
+    expected_ids = [call["id"] for call in full_response.json()]
+
+    paged_ids: list[str] = []
+    cursor = None
+
+    while True:
+        params = {"limit": 3}
+
+        if cursor:
+            params["cursor"] = cursor
+
+        page_response = client.get("/api/calls", params=params)
+        assert page_response.status_code == 200
+        paged_ids.extend(call["id"] for call in page_response.json())
+        cursor = page_response.headers.get("x-next-cursor")
+
+        if not cursor:
+            break
+
+    assert len(expected_ids) < 200
+    assert paged_ids == expected_ids
+
+
+def test_calls_endpoint_rejects_invalid_cursor() -> None:
+    response = client.get("/api/calls", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 422
+
+
+def test_calls_export_streams_ndjson_and_csv() -> None:
+    viewer_headers = login_headers(email="viewer@voicenexus.ai", password="viewer123")
+
+    ndjson_response = client.get(
+        "/api/calls/export",
+        params={"format": "ndjson", "agentName": "reception concierge"},
+        headers=viewer_headers,
+    )
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in ndjson_response.text.splitlines()]
+    assert len(records) >= 1
+    assert all(record["agentName"] == "Reception Concierge" for record in records)
+    assert [record["startedAt"] for record in records] == sorted(record["startedAt"] for record in records)
+
+    csv_response = client.get(
+        "/api/calls/export",
+        params={"format": "csv", "fromDate": records[0]["startedAt"], "toDate": records[0]["startedAt"]},
+        headers=viewer_headers,
+    )
+    assert csv_response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(csv_response.text)))
+    assert any(row["id"] == records[0]["id"] for row in rows)
+
+
+def test_calls_export_streams_parquet() -> None:
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    response = client.get("/api/calls/export", params={"format": "parquet"}, headers=login_headers())
+
+    assert response.status_code == 200
+    table = parquet.read_table(io.BytesIO(response.content))
+    assert table.num_rows >= 1
+    assert "durationSeconds" in table.schema.names
+
+
+def test_calls_export_requires_auth() -> None:
+    response = client.get("/api/calls/export")
+
+    assert response.status_code == 401
+
+
+def test_calls_filter_by_agent_name_is_case_insensitive() -> None:
+    response = client.get("/api/calls", params={"agentName": "  RECEPTION concierge ", "limit": 200})
+
+    assert response.status_code == 200
+    calls = response.json()
+    assert len(calls) >= 1
+    assert all(call["agentName"] == "Reception Concierge" for call in calls)
+    started = [call["startedAt"] for call in calls]
+    assert started == sorted(started, reverse=True)
+
+
+def test_call_session_indexes_match_listing_access_paths() -> None:
+    index_names = {index.name for index in CallSessionRecord.__table__.indexes}
+
+    assert {
+        "ix_call_sessions_started_at",
+        "ix_call_sessions_status_started_at",
+        "ix_call_sessions_agent_name_started_at",
+    } <= index_names
+
+
 def test_twilio_voice_webhook_creates_call_session() -> None:
     call_sid = f"CA-test-{uuid4().hex[:12]}"
 
@@ -189,6 +505,141 @@ def test_twilio_voice_webhook_creates_call_session() -> None:
         assert created.caller_number == "+14155559000"
 
 
+def test_calls_and_agents_are_scoped_by_organization_id() -> None:
+    call_sid = f"CA-tenant-{uuid4().hex[:12]}"
+    client.post("/api/twilio/voice", data={"CallSid": call_sid, "From": "+14155559001", "To": "+14155551042"})
+
+    with SessionLocal() as db:
+        created = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).one()
+        organization = db.query(OrganizationRecord).filter(OrganizationRecord.id == created.organization_id).one()
+        other = db.query(OrganizationRecord).filter(OrganizationRecord.id != organization.id).first()
+        assert db.query(CallSessionRecord).filter(CallSessionRecord.organization_id.is_(None)).count() == 0
+
+    tenant_calls = client.get("/api/calls", params={"organizationId": organization.organization_id, "limit": 200})
+    assert tenant_calls.status_code == 200
+    assert created.call_id in {call["id"] for call in tenant_calls.json()}
+
+    other_calls = client.get("/api/calls", params={"organizationId": other.organization_id, "limit": 200}).json()
+    assert created.call_id not in {call["id"] for call in other_calls}
+
+    by_name = client.get("/api/agents", params={"organizationName": f"  {organization.name.upper()} "}).json()
+    by_id = client.get("/api/agents", params={"organizationId": organization.organization_id}).json()
+    assert by_name and {agent["id"] for agent in by_name} == {agent["id"] for agent in by_id}
+    assert all(agent["organizationName"] == organization.name for agent in by_id)
+
+
+def test_archived_calls_are_listed_and_exported(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("pyarrow")
+    agent_name = f"Archive Desk {uuid4().hex[:8]}"
+    started = [datetime(2019, 3, 4, 9, 30, tzinfo=timezone.utc), datetime(2019, 3, 20, 16, 5, tzinfo=timezone.utc)]
+    archive = CallArchive(tmp_path)
+
+    with SessionLocal() as db:
+        for started_at in started:
+            suffix = uuid4().hex[:12]
+            db.add(
+                CallSessionRecord(
+                    call_id=f"call-archive-{suffix}",
+                    call_sid=f"CA-archive-{suffix}",
+                    agent_name=agent_name,
+                    agent_name_normalized=agent_name.lower(),
+                    caller_number="+14155550100",
+                    started_at=started_at,
+                    duration_seconds=42,
+                    status="completed",
+                    sentiment="neutral",
+                    recording_url="",
+                    updated_at=started_at,
+                )
+            )
+            db.commit()
+
+            # The second call lands in a month that already has an archive file and is merged into it.
+            assert archive.archive(db, date(2019, 4, 15)) >= 1
+
+        assert archive.months()[-1] == date(2019, 3, 1)
+        assert archive.archive(db, date(2019, 4, 15)) == 0
+        archived = [row for batch in archive.read(agent_name_normalized=agent_name.lower()) for row in batch]
+        assert [row.started_at for row in archived] == started
+        assert db.query(CallSessionRecord).filter(CallSessionRecord.agent_name == agent_name).count() == 0
+
+    monkeypatch.setattr(calls_routes, "call_archive", archive)
+
+    first_page = client.get("/api/calls", params={"agentName": agent_name, "limit": 1})
+    assert first_page.status_code == 200
+    assert first_page.json()[0]["startedAt"] == "2019-03-20 16:05"
+    second_page = client.get(
+        "/api/calls",
+        params={"agentName": agent_name, "limit": 1, "cursor": first_page.headers["X-Next-Cursor"]},
+    )
+    assert second_page.json()[0]["startedAt"] == "2019-03-04 09:30"
+    assert "X-Next-Cursor" not in second_page.headers
+
+    export_response = client.get(
+        "/api/calls/export",
+        params={"agentName": agent_name, "toDate": "2019-03-31T00:00:00Z"},
+        headers=login_headers(),
+    )
+    exported = [json.loads(line) for line in export_response.text.splitlines()]
+    assert [record["startedAt"] for record in exported] == ["2019-03-04T09:30:00Z", "2019-03-20T16:05:00Z"]
+
+
+def test_archive_read_prunes_row_groups_behind_the_cursor(tmp_path, monkeypatch) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(call_archive_module, "ARCHIVE_BATCH_SIZE", 2)
+    agent_name = f"Archive Pages {uuid4().hex[:8]}"
+    started = [datetime(2018, 6, day, 12, 0, tzinfo=timezone.utc) for day in (3, 7, 11, 15, 19)]
+    archive = CallArchive(tmp_path)
+
+    with SessionLocal() as db:
+        # Archived in two passes so the second one merges into the existing month file.
+        for passes in (started[1::2], started[0::2]):
+            for started_at in passes:
+                suffix = uuid4().hex[:12]
+                db.add(
+                    CallSessionRecord(
+                        call_id=f"call-pages-{suffix}",
+                        call_sid=f"CA-pages-{suffix}",
+                        agent_name=agent_name,
+                        agent_name_normalized=agent_name.lower(),
+                        caller_number="+14155550100",
+                        started_at=started_at,
+                        duration_seconds=30,
+                        status="completed",
+                        updated_at=started_at,
+                    )
+                )
+
+            db.commit()
+            archive.archive(db, date(2018, 7, 1))
+
+    archived = [row for batch in archive.read(agent_name_normalized=agent_name.lower()) for row in batch]
+    assert [row.started_at for row in archived] == started
+    assert pq.ParquetFile(tmp_path / "calls-2018-06.parquet").num_row_groups == 3
+
+    row_group_reads = []
+    read_row_group = pq.ParquetFile.read_row_group
+
+    def counting_read_row_group(self, index, *args, **kwargs):
+        row_group_reads.append(index)
+        return read_row_group(self, index, *args, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", counting_read_row_group)
+    page = [
+        row
+        for batch in archive.read(
+            agent_name_normalized=agent_name.lower(),
+            before=(started[2], 0),
+            newest_first=True,
+            limit=1,
+        )
+        for row in batch
+    ]
+
+    assert [row.started_at for row in page] == [started[1]]
+    assert row_group_reads == [1, 0]
+
+
 def test_twilio_gather_webhook_returns_assistant_response() -> None:
     call_sid = f"CA-test-{uuid4().hex[:12]}"
     voice_response = client.post(
@@ -215,6 +666,239 @@ def test_twilio_gather_webhook_returns_assistant_response() -> None:
     assert "<Redirect" in gather_response.text
 
 
+def test_gather_upserts_call_session_once_per_call_sid() -> None:
+    call_sid = f"CA-upsert-{uuid4().hex[:12]}"
+    turn = {"CallSid": call_sid, "From": "+14155550334", "To": "+14155551042"}
+
+    assert client.post("/api/twilio/gather", data={**turn, "SpeechResult": "Hello there"}).status_code == 200
+
+    with SessionLocal() as db:
+        created = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).one()
+        assert created.call_id.startswith("call-")
+        assert created.sentiment == "positive"
+
+    client.post("/api/twilio/voice", data=turn)
+    client.post("/api/twilio/gather", data={**turn, "SpeechResult": ""})
+
+    with SessionLocal() as db:
+        rows = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).all()
+        assert [(row.call_id, row.sentiment) for row in rows] == [(created.call_id, "neutral")]
+
+        call_session, was_created = upsert_call_session(
+            db,
+            {
+                "call_sid": call_sid,
+                "agent_name": created.agent_name,
+                "caller_number": created.caller_number,
+                "started_at": created.started_at,
+                "status": "busy",
+                "updated_at": created.updated_at,
+            },
+            {},
+        )
+        assert not was_created and call_session.call_id == created.call_id
+        db.rollback()
+
+
+def test_voice_webhook_creates_call_session_with_one_insert() -> None:
+    call_sid = f"CA-insert-{uuid4().hex[:12]}"
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+
+    try:
+        client.post("/api/twilio/voice", data={"CallSid": call_sid, "From": "+14155550335", "To": "+14155551042"})
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    call_writes = [statement for statement in statements if re.match(r"\s*(INSERT INTO|UPDATE) call_sessions", statement)]
+    assert len(call_writes) == 1 and call_writes[0].lstrip().startswith("INSERT INTO call_sessions")
+
+    with SessionLocal() as db:
+        assert db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).one().call_id.startswith("call-")
+
+
+def test_split_complete_sentences_keeps_partial_tail() -> None:
+    sentences, remainder = twilio_routes._split_complete_sentences(
+        "Sure. I can book that for tonight. What time works"
+    )
+
+    assert sentences == ["Sure. I can book that for tonight."]
+    assert remainder == "What time works"
+
+
+def test_synthesis_cache_is_content_addressed_and_byte_bounded(tmp_path) -> None:
+    cache = SynthesisCache(max_bytes=8, disk_dir=str(tmp_path))
+    greeting_key = synthesis_cache_key("Serena", "mist", "Hello,  this is   Reception.")
+
+    assert greeting_key == synthesis_cache_key("serena", "mist", "Hello, this is Reception.")
+    assert greeting_key != synthesis_cache_key("orion", "mist", "Hello, this is Reception.")
+
+    stored = cache.put(greeting_key, b"12345", "audio/mpeg")
+    assert cache.get(greeting_key) is stored
+
+    cache.put("other-key", b"678901", "audio/mpeg")
+    assert cache.get(greeting_key) is None
+
+    reloaded = cache.load_from_disk(greeting_key)
+    assert reloaded is not None
+    assert reloaded.data == b"12345"
+    assert reloaded.media_type == "audio/mpeg"
+
+
+def test_memory_audio_store_evicts_lru_and_counts_shared_blobs_once() -> None:
+    store = MemoryAudioBlobStore(max_bytes=10, ttl_seconds=60)
+    greeting = AudioBlob(key="greeting", data=b"123456", media_type="audio/mpeg")
+
+    store.put("call-a", greeting)
+    store.put("call-b", greeting)
+    assert store.stats()["bytes"] == 6
+
+    reply = AudioBlob(key="reply", data=b"7890", media_type="audio/mpeg")
+    store.put("call-c", reply)
+    assert store.stats()["bytes"] == 10
+
+    assert store.get("call-a") is greeting
+    store.put("call-d", AudioBlob(key="other", data=b"x", media_type="audio/mpeg"))
+
+    assert store.get("call-b") is None
+    assert store.get("call-c") is None
+    assert store.get("call-a") is greeting
+    stats = store.stats()
+    assert stats["evictions"] == 2
+    assert stats["bytes"] == 7
+
+
+def test_memory_audio_store_expires_entries() -> None:
+    store = MemoryAudioBlobStore(max_bytes=1024, ttl_seconds=0)
+    store.put("call-a", AudioBlob(key="greeting", data=b"123", media_type="audio/mpeg"))
+
+    assert store.get("call-a") is None
+    assert store.stats()["expirations"] == 1
+
+
+def test_directory_audio_store_is_shared_between_workers(tmp_path) -> None:
+    producer = DirectoryAudioBlobStore(max_bytes=1024, ttl_seconds=60, directory=str(tmp_path))
+    sibling = DirectoryAudioBlobStore(max_bytes=1024, ttl_seconds=60, directory=str(tmp_path))
+
+    sibling.mark_pending("reply-1")
+    assert producer.is_pending("reply-1")
+    assert producer.get("reply-1") is None
+
+    stored = AudioBlob(key="blob-1", data=b"mp3-bytes", media_type="audio/mpeg")
+    producer.put("reply-1", stored)
+    served = sibling.get("reply-1")
+
+    assert served is not None
+    assert isinstance(served.data, memoryview)
+    assert bytes(served.data) == b"mp3-bytes"
+    assert served.media_type == "audio/mpeg"
+    assert served.etag == stored.etag
+    assert not sibling.is_pending("reply-1")
+
+
+def test_twilio_audio_endpoint_supports_ranges_and_etags() -> None:
+    blob = AudioBlob(key="range-test", data=b"0123456789", media_type="audio/mpeg")
+    twilio_routes.audio_store.put("range-test-audio", blob)
+
+    full_response = client.get("/api/twilio/audio/range-test-audio")
+    assert full_response.status_code == 200
+    assert full_response.content == b"0123456789"
+    assert full_response.headers["accept-ranges"] == "bytes"
+    assert full_response.headers["etag"] == blob.etag
+    assert "immutable" in full_response.headers["cache-control"]
+
+    partial_response = client.get("/api/twilio/audio/range-test-audio", headers={"Range": "bytes=2-5"})
+    assert partial_response.status_code == 206
+    assert partial_response.content == b"2345"
+    assert partial_response.headers["content-range"] == "bytes 2-5/10"
+
+    suffix_response = client.get("/api/twilio/audio/range-test-audio", headers={"Range": "bytes=-3"})
+    assert suffix_response.status_code == 206
+    assert suffix_response.content == b"789"
+
+    unsatisfiable_response = client.get("/api/twilio/audio/range-test-audio", headers={"Range": "bytes=20-"})
+    assert unsatisfiable_response.status_code == 416
+    assert unsatisfiable_response.headers["content-range"] == "bytes */10"
+
+    cached_response = client.get("/api/twilio/audio/range-test-audio", headers={"If-None-Match": blob.etag})
+    assert cached_response.status_code == 304
+
+
+def test_twilio_gather_streams_reply_audio_sentence_by_sentence(monkeypatch) -> None:
+    async def fake_sentences(caller_text, prompt, model, openai_api_key):
+        yield "Sure, I can help with that order."
+        await asyncio.sleep(0.05)
+        yield "Your pizzas will arrive in thirty minutes."
+
+    async def fake_synthesize(text, voice_name, rime_api_key):
+        return AudioBlob(key=text, data=f"<{text}>".encode(), media_type="audio/mpeg"), "rime"
+
+    monkeypatch.setattr(twilio_routes, "_resolve_provider_keys", lambda db: ("sk-test-key", "rm-test-key"))
+    monkeypatch.setattr(twilio_routes, "_stream_reply_sentences", fake_sentences)
+    monkeypatch.setattr(twilio_routes, "_synthesize_rime_audio", fake_synthesize)
+
+    call_sid = f"CA-test-{uuid4().hex[:12]}"
+
+    with TestClient(app) as streaming_client:
+        gather_response = streaming_client.post(
+            "/api/twilio/gather",
+            data={
+                "CallSid": call_sid,
+                "From": "+14155550444",
+                "To": "+14155551042",
+                "SpeechResult": "I want to order two pizzas",
+            },
+        )
+        assert gather_response.status_code == 200
+        assert "<Play>" in gather_response.text
+
+        audio_url = gather_response.text.split("<Play>")[1].split("</Play>")[0]
+        audio_response = streaming_client.get("/api" + audio_url.split("/api", 1)[1])
+
+    assert audio_response.status_code == 200
+    assert audio_response.content == (
+        b"<Sure, I can help with that order.><Your pizzas will arrive in thirty minutes.>"
+    )
+
+
+def test_twilio_gather_does_not_concatenate_wav_sentence_audio(monkeypatch) -> None:
+    async def fake_sentences(caller_text, prompt, model, openai_api_key):
+        yield "Sure, I can help with that order."
+        yield "Your pizzas will arrive in thirty minutes."
+
+    async def fake_synthesize(text, voice_name, rime_api_key):
+        return AudioBlob(key=text, data=f"RIFF<{text}>".encode(), media_type="audio/wav"), "rime"
+
+    monkeypatch.setattr(twilio_routes, "_resolve_provider_keys", lambda db: ("sk-test-key", "rm-test-key"))
+    monkeypatch.setattr(twilio_routes, "_stream_reply_sentences", fake_sentences)
+    monkeypatch.setattr(twilio_routes, "_synthesize_rime_audio", fake_synthesize)
+
+    with TestClient(app) as streaming_client:
+        gather_response = streaming_client.post(
+            "/api/twilio/gather",
+            data={
+                "CallSid": f"CA-test-{uuid4().hex[:12]}",
+                "From": "+14155550444",
+                "To": "+14155551042",
+                "SpeechResult": "I want to order two pizzas",
+            },
+        )
+        assert gather_response.status_code == 200
+
+        audio_url = gather_response.text.split("<Play>")[1].split("</Play>")[0]
+        audio_response = streaming_client.get("/api" + audio_url.split("/api", 1)[1])
+
+    assert audio_response.status_code == 200
+    assert audio_response.headers["content-type"] == "audio/wav"
+    assert audio_response.content == (
+        b"RIFF<Sure, I can help with that order. Your pizzas will arrive in thirty minutes.>"
+    )
+
+
 def test_twilio_recording_webhook_updates_recording_url() -> None:
     call_sid = f"CA-test-{uuid4().hex[:12]}"
     voice_response = client.post(
@@ -277,6 +961,110 @@ def test_twilio_status_webhook_updates_existing_call() -> None:
         assert updated.recording_url == "https://example.com/recordings/call.wav"
 
 
+def test_twilio_callbacks_are_coalesced_by_write_behind_buffer(tmp_path, monkeypatch) -> None:
+    call_sid = f"CA-buffered-{uuid4().hex[:12]}"
+    client.post("/api/twilio/voice", data={"CallSid": call_sid, "From": "+14155550111", "To": "+14155551042"})
+    buffer = CallbackBuffer(tmp_path / "live", 60.0, 100, twilio_routes._flush_call_updates)
+    monkeypatch.setattr(twilio_routes.runtime_settings, "twilio_callback_write_behind_enabled", True)
+    monkeypatch.setattr(twilio_routes, "callback_buffer", buffer)
+
+    status_response = client.post(
+        "/api/twilio/status",
+        data={"CallSid": call_sid, "CallStatus": "completed", "CallDuration": "30"},
+    )
+    recording_response = client.post(
+        "/api/twilio/recording",
+        data={"CallSid": call_sid, "RecordingUrl": "https://example.com/r.wav", "RecordingDuration": "45"},
+    )
+    assert status_response.json() == {"status": "accepted"}
+    assert recording_response.json() == {"status": "accepted"}
+    assert buffer.pending_count() == 1
+
+    with SessionLocal() as db:
+        assert db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).one().status == "busy"
+
+    buffer.close()
+
+    with SessionLocal() as db:
+        updated = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).one()
+        assert (updated.status, updated.duration_seconds) == ("completed", 45)
+        assert updated.recording_url == "https://example.com/r.wav"
+
+    assert list((tmp_path / "live").iterdir()) == []
+
+    crashed_dir = tmp_path / "crashed"
+    crashed_dir.mkdir()
+    (crashed_dir / "callbacks-999999999-00000001.wal").write_text(
+        json.dumps({"callSid": call_sid, "kind": "status", "status": "failed", "duration": 12, "recordingUrl": ""})
+        + '\n{"callSid": "CA-torn',
+        encoding="utf-8",
+    )
+    recovered = CallbackBuffer(crashed_dir, 60.0, 100, twilio_routes._flush_call_updates)
+    recovered.start()
+    assert recovered.pending_count() == 1
+    assert recovered.flush() == 1
+    recovered.close()
+
+    with SessionLocal() as db:
+        updated = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).one()
+        assert (updated.status, updated.duration_seconds) == ("failed", 12)
+
+    assert list(crashed_dir.iterdir()) == []
+
+
+def test_buffered_callbacks_flush_usage_in_one_statement(tmp_path) -> None:
+    call_sids = [f"CA-batch-{uuid4().hex[:12]}" for _ in range(3)]
+
+    for call_sid in call_sids:
+        client.post("/api/twilio/voice", data={"CallSid": call_sid, "From": "+14155550111", "To": "+14155551042"})
+
+    buffer = CallbackBuffer(tmp_path, 60.0, 100, twilio_routes._flush_call_updates)
+
+    for duration, call_sid in enumerate(call_sids, start=20):
+        buffer.submit({"callSid": call_sid, "kind": "status", "status": "completed", "duration": duration})
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+
+    try:
+        assert buffer.flush() == 3
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+        buffer.close()
+
+    assert sum("usage_daily" in statement for statement in statements) == 1
+    assert any("FROM call_sessions" in statement and "ORDER BY call_sessions.id" in statement for statement in statements)
+    assert not any("SAVEPOINT" in statement for statement in statements)
+
+    with SessionLocal() as db:
+        durations = {
+            row.call_sid: row.duration_seconds
+            for row in db.query(CallSessionRecord).filter(CallSessionRecord.call_sid.in_(call_sids))
+        }
+
+    assert durations == dict(zip(call_sids, (20, 21, 22)))
+
+
+def test_callback_buffer_backs_off_while_flushes_fail(tmp_path) -> None:
+    buffer = CallbackBuffer(tmp_path, 0.05, 100, lambda updates: None)
+
+    assert buffer._retry_delay(1) == pytest.approx(0.1)
+    assert buffer._retry_delay(4) == pytest.approx(0.8)
+    assert buffer._retry_delay(50) == 30.0
+
+
+def test_provider_clients_are_pooled_per_provider() -> None:
+    openai_client = get_provider_client(OPENAI_PROVIDER)
+
+    assert get_provider_client(OPENAI_PROVIDER) is openai_client
+    assert get_provider_client(RIME_PROVIDER) is not openai_client
+    assert str(openai_client.base_url).startswith("https://api.openai.com")
+
+
 def test_dashboard_overview_endpoint() -> None:
     response = client.get("/api/dashboard/overview")
 
@@ -297,6 +1085,288 @@ def test_dashboard_usage_endpoint() -> None:
     assert "minutes" in usage[0]
 
 
+def test_dashboard_aggregates_follow_call_traffic() -> None:
+    before_usage = client.get("/api/dashboard/usage").json()
+    before_kpi = client.get("/api/dashboard/overview").json()["kpi"]
+    call_sid = f"CA-test-{uuid4().hex[:12]}"
+    client.post("/api/twilio/voice", data={"CallSid": call_sid, "From": "+14155550111", "To": "+14155551042"})
+    client.post("/api/twilio/status", data={"CallSid": call_sid, "CallStatus": "completed", "CallDuration": "600"})
+
+    after_usage = client.get("/api/dashboard/usage").json()
+    after_kpi = client.get("/api/dashboard/overview").json()["kpi"]
+    assert after_usage[-1]["minutes"] - before_usage[-1]["minutes"] == 10
+    assert after_kpi["totalMinutes"] - before_kpi["totalMinutes"] == 10
+    assert after_kpi["activeAgents"] >= 1
+    assert after_kpi["totalClients"] >= 1
+
+
+def test_dashboard_and_organizations_revalidate_with_etags() -> None:
+    for path in ("/api/dashboard/overview", "/api/dashboard/usage", "/api/organizations"):
+        response = client.get(path)
+        etag = response.headers["etag"]
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        revalidated = client.get(path, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == etag
+        assert revalidated.content == b""
+
+
+def test_response_cache_keys_on_validated_parameters() -> None:
+    response_cache.clear()
+
+    for index in range(50):
+        assert client.get(f"/api/organizations?junk={index}").status_code == 200
+
+    assert response_cache.size() == 1
+
+    client.get("/api/organizations?limit=5")
+    assert response_cache.size() == 2
+
+
+def test_response_cache_drops_expired_and_least_recent_entries() -> None:
+    cache = ResponseCache(max_entries=2)
+    cache.put("dashboard", "expired", b"{}", 0)
+    assert cache.get("dashboard", "expired") is None
+    assert cache.size() == 0
+
+    cache.put("dashboard", "overview", b"{}", 60)
+    cache.put("dashboard", "usage", b"[]", 60)
+    assert cache.get("dashboard", "overview") is not None
+
+    cache.put("organizations", "list::100:0", b"[]", 60)
+    assert cache.size() == 2
+    assert cache.get("dashboard", "usage") is None
+    assert cache.get("dashboard", "overview") is not None
+
+
+def test_agent_changes_invalidate_cached_dashboard() -> None:
+    before = client.get("/api/dashboard/overview").json()["kpi"]["activeAgents"]
+    created = client.post(
+        "/api/agents",
+        json={
+            "name": "Cache Probe",
+            "organizationName": "Dental Clinic X",
+            "model": "gpt-4.1-mini",
+            "voiceId": "rime-serena",
+            "twilioNumber": "+1 (415) 555-0000",
+            "status": "active",
+            "prompt": "Probe prompt",
+            "promptVersion": "v1.0",
+            "averageLatencyMs": 700,
+        },
+    )
+    assert created.status_code == 201
+    assert client.get("/api/dashboard/overview").json()["kpi"]["activeAgents"] == before + 1
+    client.delete(f"/api/agents/{created.json()['id']}")
+    assert client.get("/api/dashboard/overview").json()["kpi"]["activeAgents"] == before
+
+
+def test_event_stream_relays_published_frames() -> None:
+    async def scenario() -> tuple[bytes, bytes]:
+        stream = events_routes._stream_events()
+        retry_frame = await stream.__anext__()
+        next_frame = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        await asyncio.to_thread(event_bus.publish, "agent-changed", {"action": "updated"})
+        frame = await asyncio.wait_for(next_frame, timeout=2)
+        await stream.aclose()
+        return retry_frame, frame
+
+    retry_frame, frame = asyncio.run(scenario())
+
+    assert retry_frame.startswith(b"retry:")
+    assert frame == b'event: agent-changed\ndata: {"action":"updated"}\n\n'
+    assert event_bus.subscriber_count() == 0
+
+
+def test_twilio_callbacks_publish_call_events() -> None:
+    call_sid = f"CA-test-{uuid4().hex[:12]}"
+
+    async def scenario() -> list[bytes]:
+        with event_bus.subscribe() as queue:
+            await asyncio.to_thread(
+                client.post,
+                "/api/twilio/voice",
+                data={"CallSid": call_sid, "From": "+14155550111", "To": "+14155551042"},
+            )
+            await asyncio.to_thread(
+                client.post,
+                "/api/twilio/status",
+                data={"CallSid": call_sid, "CallStatus": "completed", "CallDuration": "12"},
+            )
+            return [await asyncio.wait_for(queue.get(), timeout=2) for _ in range(2)]
+
+    created, changed = asyncio.run(scenario())
+
+    assert created.startswith(b"event: call-created\n")
+    assert changed.startswith(b"event: call-status-changed\n")
+    assert json.loads(changed.split(b"data: ", 1)[1])["durationSeconds"] == 12
+
+
+def test_usage_rollup_matches_rebuild_after_callbacks() -> None:
+    call_sid = f"CA-test-{uuid4().hex[:12]}"
+    client.post("/api/twilio/voice", data={"CallSid": call_sid, "From": "+14155550111", "To": "+14155551042"})
+    client.post("/api/twilio/status", data={"CallSid": call_sid, "CallStatus": "in-progress", "CallDuration": "40"})
+    client.post("/api/twilio/recording", data={"CallSid": call_sid, "RecordingDuration": "75"})
+    client.post("/api/twilio/status", data={"CallSid": call_sid, "CallStatus": "completed", "CallDuration": "90"})
+
+    midnight_sid = f"CA-midnight-{uuid4().hex[:12]}"
+    midnight_started_at = datetime(2026, 3, 14, 23, 59, 50, tzinfo=timezone.utc)
+    client.post("/api/twilio/voice", data={"CallSid": midnight_sid, "From": "+14155550111", "To": "+14155551042"})
+
+    with SessionLocal() as db:
+        db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == midnight_sid).update(
+            {"started_at": midnight_started_at}
+        )
+        db.commit()
+
+    client.post("/api/twilio/status", data={"CallSid": midnight_sid, "CallStatus": "completed", "CallDuration": "45"})
+
+    def snapshot() -> dict[tuple, tuple[int, int]]:
+        with SessionLocal() as db:
+            return {
+                (row.organization_id, row.agent_name_normalized, row.day): (row.call_count, row.duration_seconds)
+                for row in db.query(UsageDailyRecord).all()
+                if row.duration_seconds or row.call_count
+            }
+
+    incremental = snapshot()
+
+    with SessionLocal() as db:
+        rebuild_usage_daily(db)
+        db.commit()
+
+    assert snapshot() == incremental
+
+    with SessionLocal() as db:
+        organization_id = db.query(CallSessionRecord).filter(CallSessionRecord.call_sid == call_sid).one().organization_id
+
+    assert any(key[0] == organization_id and key[1] == "reception concierge" for key in incremental)
+    assert (organization_id, "reception concierge", date(2026, 3, 14)) in incremental
+
+
+def test_status_callback_rollup_does_not_read_agents() -> None:
+    call_sid = f"CA-noscan-{uuid4().hex[:12]}"
+    client.post("/api/twilio/voice", data={"CallSid": call_sid, "From": "+14155550111", "To": "+14155551042"})
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+
+    try:
+        client.post("/api/twilio/status", data={"CallSid": call_sid, "CallStatus": "completed", "CallDuration": "33"})
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert any("usage_daily" in statement for statement in statements)
+    assert not any(re.search(r"\bagents\b", statement) for statement in statements)
+
+
+def test_usage_rollup_is_keyed_by_call_organization() -> None:
+    agent_name = f"Shared Desk {uuid4().hex[:6]}"
+    minutes_by_tenant = {}
+
+    for index, duration in enumerate((120, 300)):
+        tenant_name = f"Shared Tenant {uuid4().hex[:8]}"
+        number = f"+1415555{7100 + index + int(uuid4().int % 800):04d}"
+        client.post(
+            "/api/agents",
+            json={
+                "name": agent_name,
+                "organizationName": tenant_name,
+                "model": "gpt-4.1-mini",
+                "voiceId": "rime-luna",
+                "twilioNumber": number,
+                "status": "active",
+                "prompt": "You are a shared desk.",
+                "promptVersion": "v1.0",
+            },
+        )
+        call_sid = f"CA-shared-{uuid4().hex[:12]}"
+        client.post("/api/twilio/voice", data={"CallSid": call_sid, "From": "+14155550111", "To": number})
+        client.post(
+            "/api/twilio/status",
+            data={"CallSid": call_sid, "CallStatus": "completed", "CallDuration": str(duration)},
+        )
+        minutes_by_tenant[tenant_name] = duration // 60
+
+    organizations = client.get("/api/organizations", params={"subscriptionStatus": "trial", "limit": 500}).json()
+    reported = {org["name"]: org["monthlyMinutes"] for org in organizations if org["name"] in minutes_by_tenant}
+    assert reported == minutes_by_tenant
+
+
+def test_call_organization_backfill_runs_once_and_skips_newer_agents() -> None:
+    agent_name = f"Backfill Desk {uuid4().hex[:6]}"
+    started_at = datetime(2026, 1, 5, 9, 0, tzinfo=timezone.utc)
+    agent_ids = []
+
+    with SessionLocal() as db:
+        # The agent created after the call has the lower id, so only created_at keeps it out.
+        for offset_days, tenant in ((1, "newer"), (-1, "older")):
+            organization = OrganizationRecord(
+                organization_id=f"org-backfill-{uuid4().hex[:8]}",
+                name=f"Backfill {tenant} {uuid4().hex[:6]}",
+                name_normalized=f"backfill {tenant} {uuid4().hex[:6]}",
+                subscription_status="trial",
+                updated_at=datetime.now(timezone.utc),
+            )
+            db.add(organization)
+            db.flush()
+            agent = AgentRecord(
+                agent_id=f"agent-backfill-{uuid4().hex[:8]}",
+                name=agent_name,
+                organization_id=organization.id,
+                organization_name=organization.name,
+                model="gpt-4.1-mini",
+                voice_id="rime-luna",
+                twilio_number="",
+                status="inactive",
+                prompt="Backfill probe",
+                prompt_version="v1.0",
+                created_at=started_at.replace(day=started_at.day + offset_days),
+                updated_at=datetime.now(timezone.utc),
+            )
+            db.add(agent)
+            db.flush()
+            agent_ids.append((agent.id, organization.id))
+
+        call = CallSessionRecord(
+            call_id=f"call-backfill-{uuid4().hex[:8]}",
+            call_sid=f"CA-backfill-{uuid4().hex[:12]}",
+            agent_name=agent_name,
+            agent_name_normalized=agent_name.lower(),
+            caller_number="+14155550999",
+            started_at=started_at,
+            status="completed",
+            updated_at=datetime.now(timezone.utc),
+        )
+        db.add(call)
+        db.commit()
+
+    initialize_database()
+
+    with SessionLocal() as db:
+        assert db.get(CallSessionRecord, call.id).organization_id is None
+
+        db_module._backfill_call_organizations(db)
+        db.commit()
+        linked = db.get(CallSessionRecord, call.id, populate_existing=True).organization_id
+
+        db.delete(db.get(CallSessionRecord, call.id))
+
+        for agent_id, _ in agent_ids:
+            db.delete(db.get(AgentRecord, agent_id))
+
+        db.commit()
+
+    assert linked == agent_ids[1][1]
+
+
 def test_auth_login_endpoint() -> None:
     response = client.post(
         "/api/auth/login",
@@ -361,6 +1431,22 @@ def test_settings_history_meta_endpoint() -> None:
     assert isinstance(payload["changedFields"], list)
 
 
+def test_settings_history_meta_aggregates_within_date_range() -> None:
+    response = client.get(
+        "/api/settings/history/meta",
+        params={"fromDate": "2026-02-10T00:00:00Z", "toDate": "2026-02-10T23:59:59Z"},
+        headers=login_headers(),
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["actors"] == ["system-bootstrap"]
+    assert payload["totalEntries"] == 1
+    assert len(payload["changedFields"]) == 7
+    assert payload["changedFields"] == sorted(payload["changedFields"])
+    assert payload["earliestChangedAt"] == payload["latestChangedAt"] == "2026-02-10T09:00:00Z"
+
+
 def test_settings_history_filters_by_actor_and_date() -> None:
     admin_headers = login_headers()
 
@@ -432,6 +1518,65 @@ def test_settings_history_filters_by_actor_and_date() -> None:
     assert len(paged_entries) <= 1
 
 
+def test_settings_history_filters_use_normalized_columns() -> None:
+    admin_headers = login_headers()
+    current_settings = client.get("/api/settings", headers=admin_headers).json()
+    update_response = client.patch(
+        "/api/settings",
+        json={
+            "enableBargeInInterruption": not current_settings["enableBargeInInterruption"],
+            "auditActor": "Mixed-Case Auditor",
+        },
+        headers=admin_headers,
+    )
+    assert update_response.status_code == 200
+
+    entries = client.get(
+        "/api/settings/history",
+        params={"actor": "  mixed-case auditor ", "changedField": "ENABLEBARGEININTERRUPTION"},
+        headers=admin_headers,
+    ).json()
+    assert len(entries) >= 1
+    assert all(entry["actor"] == "Mixed-Case Auditor" for entry in entries)
+
+    with SessionLocal() as db:
+        indexed_fields = (
+            db.query(SettingsAuditFieldRecord.field_name)
+            .filter(SettingsAuditFieldRecord.event_id == entries[0]["id"])
+            .all()
+        )
+    assert [field for (field,) in indexed_fields] == ["enableBargeInInterruption"]
+
+
+def test_settings_audit_batches_allocate_sequential_event_ids() -> None:
+    actor = f"batch-auditor-{uuid4().hex[:8]}"
+
+    with SessionLocal() as db:
+        event_ids = record_settings_audit(
+            db,
+            [
+                SettingsAuditDraft(actor, None, ["rimeApiKey"]),
+                SettingsAuditDraft(actor, "Rotated keys", ["openaiApiKey", "rimeApiKey"]),
+            ],
+        )
+        db.commit()
+        field_count = (
+            db.query(SettingsAuditFieldRecord).filter(SettingsAuditFieldRecord.event_id.in_(event_ids)).count()
+        )
+
+    first, second = (int(event_id.rsplit("-", 1)[1]) for event_id in event_ids)
+    assert all(event_id.startswith("settings-audit-") for event_id in event_ids)
+    assert second == first + 1
+    assert field_count == 3
+
+    entries = client.get(
+        "/api/settings/history",
+        params={"actor": actor},
+        headers=login_headers(),
+    ).json()
+    assert {entry["id"] for entry in entries} == set(event_ids)
+
+
 def test_settings_history_rejects_invalid_date_range() -> None:
     admin_headers = login_headers()
 
@@ -567,6 +1712,45 @@ def test_update_settings_ignores_masked_secret_placeholders() -> None:
         assert updated.allow_auto_retry_on_failed_calls is (not original_auto_retry)
 
 
+def test_platform_settings_snapshot_follows_version_bumps() -> None:
+    cache = PlatformSettingsCache(check_interval_seconds=60)
+
+    with SessionLocal() as db:
+        snapshot = cache.get(db)
+        assert snapshot is not None
+        assert cache.get(db) is snapshot
+
+        record = db.query(PlatformSettingsRecord).first()
+        record.deepgram_api_key = "dg-written-by-sibling-worker"
+        record.version = record.version + 1
+        db.commit()
+
+        assert cache.get(db) is snapshot
+        cache.check_interval_seconds = 0
+        refreshed = cache.get(db)
+
+    assert refreshed.version == snapshot.version + 1
+    assert refreshed.deepgram_api_key == "dg-written-by-sibling-worker"
+
+
+def test_update_settings_bumps_version_and_local_snapshot() -> None:
+    with SessionLocal() as db:
+        before = db.query(PlatformSettingsRecord).first()
+
+    response = client.patch(
+        "/api/settings",
+        json={"enableBargeInInterruption": not before.enable_barge_in_interruption},
+        headers=login_headers(),
+    )
+    assert response.status_code == 200
+
+    with SessionLocal() as db:
+        snapshot = platform_settings_cache.get(db)
+
+    assert snapshot.version == before.version + 1
+    assert snapshot.enable_barge_in_interruption is (not before.enable_barge_in_interruption)
+
+
 def test_update_settings_rejects_invalid_keys() -> None:
     admin_headers = login_headers()
 